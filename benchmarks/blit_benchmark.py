@@ -0,0 +1,45 @@
+import os
+import sys
+import time
+import tkinter as tk
+import numpy as np
+import cv2
+from PIL import Image, ImageTk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from cropper import BlitSurface
+
+SIZES = [(1920, 1080), (3840, 2160)]
+FRAMES = 30
+
+def old_path(img):
+    rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+    frame = Image.frombuffer("RGB", (img.shape[1], img.shape[0]), rgb, 'raw', 'RGB', 0, 1)
+    return ImageTk.PhotoImage(image=frame)
+
+def run(root, canvas, frames, draw):
+    item = canvas.create_image(0, 0, anchor="nw")
+    start = time.perf_counter()
+    for img in frames:
+        canvas.itemconfig(item, image=draw(img))
+        root.update_idletasks()
+    elapsed = time.perf_counter() - start
+    canvas.delete(item)
+    return elapsed * 1000 / len(frames)
+
+def main():
+    root = tk.Tk()
+    canvas = tk.Canvas(root, highlightthickness=0)
+    canvas.pack(fill="both", expand=True)
+    rng = np.random.default_rng(0)
+    for w, h in SIZES:
+        canvas.config(width=w, height=h)
+        frames = [(rng.random((h, w, 3)) * 255).astype(np.uint8) for _ in range(4)] * (FRAMES // 4)
+        surface = BlitSurface()
+        old_ms = run(root, canvas, frames, old_path)
+        new_ms = run(root, canvas, frames, surface.update)
+        print(f"{w}x{h}  cv2_to_imagetk {old_ms:7.1f} ms/frame  BlitSurface {new_ms:7.1f} ms/frame")
+    root.destroy()
+
+if __name__ == "__main__":
+    main()
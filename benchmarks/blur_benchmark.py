@@ -0,0 +1,38 @@
+import os
+import sys
+import time
+import numpy as np
+import cv2
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from cropper import gaussian_blur
+
+SIZES = [(1920, 1080), (6000, 4000)]
+STRENGTHS = [1, 5, 10, 25, 50, 100]
+RUNS = 3
+
+def make_image(w, h):
+    rng = np.random.default_rng(0)
+    noise = (rng.random((h // 8, w // 8, 3)) * 255).astype(np.uint8)
+    return cv2.resize(noise, (w, h), interpolation=cv2.INTER_CUBIC)
+
+def best_of(fn):
+    best = float("inf")
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def main():
+    for w, h in SIZES:
+        img = make_image(w, h)
+        print(f"{w}x{h}")
+        for val in STRENGTHS:
+            ksize = int(val * 4 * max(w, h) / 1000.0) + 1
+            if ksize % 2 == 0: ksize += 1
+            ms = best_of(lambda: gaussian_blur(img, ksize))
+            print(f"  strength {val:>3}  kernel {ksize:>5}  {ms:8.1f} ms")
+
+if __name__ == "__main__":
+    main()
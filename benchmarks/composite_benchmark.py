@@ -0,0 +1,48 @@
+import os
+import sys
+import time
+import numpy as np
+import cv2
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from cropper import fill_rect, blit_clipped, bgr_frame
+
+CANVAS = (1920, 1080)
+GRIDS = [(2, 2), (4, 4), (8, 8)]
+GAP = 8
+RUNS = 5
+
+def make_tiles(n, w, h):
+    rng = np.random.default_rng(0)
+    return [(rng.random((h, w, 3)) * 255).astype(np.uint8) for _ in range(n)]
+
+def best_of(fn):
+    best = float("inf")
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def compose(frame, tiles, cols, cw, ch):
+    frame[:] = (17, 17, 17)
+    fill_rect(frame, 0, 0, frame.shape[1], frame.shape[0], (13, 13, 13))
+    for i, tile in enumerate(tiles):
+        x, y = (i % cols) * (cw + GAP), (i // cols) * (ch + GAP)
+        fill_rect(frame, x, y, x + cw, y + ch, (17, 17, 17))
+        small = cv2.resize(tile, (cw + 40, ch + 40), interpolation=cv2.INTER_LINEAR)
+        blit_clipped(frame, small, x - 20, y - 20, (x, y, x + cw, y + ch))
+
+def main():
+    w, h = CANVAS
+    frame = np.empty((h, w, 3), np.uint8)
+    print(f"canvas {w}x{h}")
+    for cols, rows in GRIDS:
+        cw, ch = (w - (cols - 1) * GAP) // cols, (h - (rows - 1) * GAP) // rows
+        tiles = make_tiles(cols * rows, 512, 384)
+        ms = best_of(lambda: compose(frame, tiles, cols, cw, ch))
+        conv = best_of(lambda: bgr_frame(frame))
+        print(f"  {cols}x{rows} tiles  compose {ms:7.1f} ms  to RGB {conv:6.1f} ms")
+
+if __name__ == "__main__":
+    main()
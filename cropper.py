@@ -3,12 +3,23 @@ import os
 import gc
 import ctypes
 import math
+import mmap
+import io
 import json
+import zipfile
+import hashlib
+import struct
+import time
+import queue
+import threading
+import weakref
 from pathlib import Path
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import Canvas, NW, BOTH, Button, Frame, Label, IntVar, StringVar, Entry, Toplevel, messagebox, colorchooser, filedialog
 from tkinterdnd2 import DND_FILES, TkinterDnD
-from PIL import Image, ImageTk, ImageFilter, ImageDraw, ImageGrab
+from PIL import Image, ImageTk, ImageDraw, ImageGrab
 import cv2
 import numpy as np
 import webbrowser
@@ -26,6 +37,28 @@ PADDING = 20
 DEFAULT_BANNER_THICKNESS_RATIO = 0.25 
 HANDLE_SIZE = 8 
 SETTINGS_FILE = "cropper_settings.json"
+DECODE_WORKERS = max(2, min(8, (os.cpu_count() or 4) - 1))
+UI_POLL_MS = 15
+FRAME_MS = 16
+SETTLE_MS = 150
+INTERACTIVE_INTERPOLATIONS = (cv2.INTER_NEAREST, cv2.INTER_LINEAR)
+PROXY_SIZE = 2048
+REDUCED_DECODE_FLAGS = ((8, cv2.IMREAD_REDUCED_COLOR_8), (4, cv2.IMREAD_REDUCED_COLOR_4), (2, cv2.IMREAD_REDUCED_COLOR_2))
+REDUCED_DECODE_FORMATS = ("JPEG", "MPO")
+EXIF_HEADER_BYTES = 128 * 1024
+PROXY_CACHE_DIR = os.path.join(os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), ".cache"), "cropper", "proxies")
+DEFAULT_PROXY_CACHE_MB = 512
+DEFAULT_MEMORY_BUDGET_MB = 2048
+PROXY_CACHE_TRIM_EVERY = 32
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".jfif", ".jpe", ".png", ".bmp", ".dib", ".tif", ".tiff", ".webp", ".jp2", ".ppm", ".pgm", ".pbm"}
+ARCHIVE_EXTENSIONS = {".zip", ".cbz"}
+STRIP_ROWS = 512
+BLUR_PYRAMID_SIGMA = 2.0
+SCREEN_TILE_SIZE = 256
+SCREEN_TILE_CACHE = 384
+RENDER_CACHE_MB = 256
+
+Image.MAX_IMAGE_PIXELS = None
 
 
 class TitleBarButton(Canvas):
@@ -239,35 +272,731 @@ def set_appwindow(root):
     root.wm_withdraw()
     root.after(10, lambda: root.wm_deiconify())
 
+def probe_image_info(source):
+    try:
+        with Image.open(source) as im:
+            w, h = im.size
+            fmt = im.format
+            orientation = im.getexif().get(0x0112, 1) if fmt in REDUCED_DECODE_FORMATS else 1
+    except Exception:
+        return None
+    if orientation in (5, 6, 7, 8): w, h = h, w
+    return w, h, fmt
+
+def probe_image_size(source):
+    info = probe_image_info(source)
+    return info[:2] if info else None
+
+def reduced_decode_flag(w, h, target):
+    for factor, flag in REDUCED_DECODE_FLAGS:
+        if max(w, h) // factor >= target: return factor, flag
+    return 1, cv2.IMREAD_COLOR
+
+def apply_exif_orientation(img, orientation):
+    if orientation == 2: return cv2.flip(img, 1)
+    if orientation == 3: return cv2.rotate(img, cv2.ROTATE_180)
+    if orientation == 4: return cv2.flip(img, 0)
+    if orientation == 5: return cv2.transpose(img)
+    if orientation == 6: return cv2.rotate(img, cv2.ROTATE_90_CLOCKWISE)
+    if orientation == 7: return cv2.flip(cv2.transpose(img), -1)
+    if orientation == 8: return cv2.rotate(img, cv2.ROTATE_90_COUNTERCLOCKWISE)
+    return img
+
+def read_exif_thumbnail(path):
+    try:
+        with open(path, "rb") as f:
+            head = f.read(EXIF_HEADER_BYTES)
+    except OSError:
+        return None
+    return parse_exif_thumbnail(head)
+
+def parse_exif_thumbnail(head):
+    try:
+        if head[:2] != b"\xff\xd8": return None
+
+        pos = 2
+        while pos + 4 <= len(head) and head[pos] == 0xFF:
+            marker = head[pos + 1]
+            length = struct.unpack(">H", head[pos + 2:pos + 4])[0]
+            if marker == 0xE1 and head[pos + 4:pos + 10] == b"Exif\0\0": break
+            if marker in (0xDA, 0xD9): return None
+            pos += 2 + length
+        else:
+            return None
+
+        tiff = head[pos + 10:pos + 2 + length]
+        endian = "<" if tiff[:2] == b"II" else ">"
+
+        def read_ifd(offset):
+            count = struct.unpack(endian + "H", tiff[offset:offset + 2])[0]
+            entries = {}
+            for i in range(count):
+                e = offset + 2 + i * 12
+                tag, typ = struct.unpack(endian + "HH", tiff[e:e + 4])
+                fmt = "H" if typ == 3 else "I"
+                entries[tag] = struct.unpack(endian + fmt, tiff[e + 8:e + 8 + struct.calcsize(fmt)])[0]
+            next_offset = struct.unpack(endian + "I", tiff[offset + 2 + count * 12:offset + 6 + count * 12])[0]
+            return entries, next_offset
+
+        ifd0, ifd1_offset = read_ifd(struct.unpack(endian + "I", tiff[4:8])[0])
+        if not ifd1_offset: return None
+        ifd1, _ = read_ifd(ifd1_offset)
+        start, size = ifd1.get(0x0201), ifd1.get(0x0202)
+        if not start or not size or start + size > len(tiff): return None
+
+        thumb = cv2.imdecode(np.frombuffer(tiff[start:start + size], dtype=np.uint8), cv2.IMREAD_COLOR)
+        if thumb is None: return None
+        return apply_exif_orientation(thumb, ifd0.get(0x0112, 1))
+    except (struct.error, IndexError):
+        return None
+
+def match_orientation(size, img):
+    w, h = size
+    ih, iw = img.shape[:2]
+    if (iw > ih) != (w > h) and iw != ih and w != h: return h, w
+    return w, h
+
+def read_image(path, flags=cv2.IMREAD_COLOR):
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0: return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return cv2.imdecode(np.frombuffer(mm, dtype=np.uint8), flags)
+
+def decode_image_bytes(data, flags=cv2.IMREAD_COLOR):
+    if not data: return None
+    return cv2.imdecode(np.frombuffer(data, dtype=np.uint8), flags)
+
+def file_identity(path, member=None):
+    st = os.stat(path)
+    return (os.path.normcase(os.path.realpath(path)), st.st_size, st.st_mtime_ns, member)
+
+class ArchivePool:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.handles = []
+        self.epoch = 0
+
+    def open(self, path, epoch):
+        # One handle per worker thread so reads and inflates run in parallel
+        local = self.local
+        if getattr(local, "epoch", None) != epoch:
+            local.epoch = epoch
+            local.archives = {}
+        archive = local.archives.get(path)
+        if archive is None:
+            archive = zipfile.ZipFile(path)
+            with self.lock:
+                if epoch == self.epoch: self.handles.append(archive)
+            if epoch != self.epoch:
+                archive.close()
+                raise ValueError(f"Archive closed: {Path(path).name}")
+            local.archives[path] = archive
+        return archive
+
+    def read(self, path, member, epoch):
+        if epoch != self.epoch: raise ValueError(f"Archive closed: {Path(path).name}")
+        return self.open(path, epoch).read(member)
+
+    def close(self):
+        with self.lock:
+            self.epoch += 1
+            handles, self.handles = self.handles, []
+        for archive in handles: archive.close()
+
+ARCHIVES = ArchivePool()
+
+def read_archive_member(path, member, epoch):
+    return ARCHIVES.read(path, member, epoch)
+
+def close_archives():
+    ARCHIVES.close()
+
+def is_image_name(name):
+    return os.path.splitext(name)[1].lower() in IMAGE_EXTENSIONS
+
+def is_archive_name(name):
+    return os.path.splitext(name)[1].lower() in ARCHIVE_EXTENSIONS
+
+def list_archive_images(path):
+    try:
+        with zipfile.ZipFile(path) as archive:
+            names = archive.namelist()
+    except (OSError, zipfile.BadZipFile) as e:
+        print(f"Archive error: {e}")
+        return []
+    names = [n for n in names if is_image_name(n) and not n.endswith("/") and not n.startswith("__MACOSX/")]
+    return [(path, n) for n in sorted(names, key=str.lower)]
+
+def scan_folder(folder):
+    found = []
+    stack = [folder]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = sorted(it, key=lambda e: e.name.lower())
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False): subdirs.append(entry.path)
+                elif entry.is_file() and is_image_name(entry.name): found.append((entry.path, None))
+                elif entry.is_file() and is_archive_name(entry.name): found.extend(list_archive_images(entry.path))
+            except OSError: pass
+        stack.extend(reversed(subdirs))
+    return found
+
+def scan_image_sources(paths):
+    sources = []
+    for p in paths:
+        if os.path.isdir(p): sources.extend(scan_folder(p))
+        elif os.path.isfile(p) and is_archive_name(p): sources.extend(list_archive_images(p))
+        elif os.path.isfile(p): sources.append((p, None))
+    return sources
+
+def freeze(img):
+    img.flags.writeable = False
+    return img
+
+def bgr_to_pil(img):
+    return Image.fromarray(cv2.cvtColor(img, cv2.COLOR_BGR2RGB))
+
+def bgr_frame(img):
+    h, w = img.shape[:2]
+    return Image.frombuffer("RGB", (w, h), np.ascontiguousarray(img), "raw", "BGR", 0, 1)
+
+class BlitSurface:
+    def __init__(self):
+        self.photo = None
+        self.size = None
+
+    def update(self, img):
+        frame = bgr_frame(img)
+        if self.photo is None or self.size != frame.size:
+            self.photo = ImageTk.PhotoImage(image=frame)
+            self.size = frame.size
+        else:
+            self.photo.paste(frame)
+        return self.photo
+
+def fill_rect(frame, x0, y0, x1, y1, color):
+    fh, fw = frame.shape[:2]
+    x0, y0 = max(0, int(x0)), max(0, int(y0))
+    x1, y1 = min(fw, int(x1)), min(fh, int(y1))
+    if x1 > x0 and y1 > y0: frame[y0:y1, x0:x1] = color
+
+def blit_clipped(frame, img, x, y, clip=None):
+    fh, fw = frame.shape[:2]
+    h, w = img.shape[:2]
+    x, y = int(x), int(y)
+    cx0, cy0, cx1, cy1 = map(int, clip) if clip else (0, 0, fw, fh)
+    x0, y0 = max(x, cx0, 0), max(y, cy0, 0)
+    x1, y1 = min(x + w, cx1, fw), min(y + h, cy1, fh)
+    if x1 > x0 and y1 > y0: frame[y0:y1, x0:x1] = img[y0 - y:y1 - y, x0 - x:x1 - x]
+
+def strip_bounds(h, rows, halo):
+    for y0 in range(0, h, rows):
+        y1 = min(h, y0 + rows)
+        yield y0, y1, max(0, y0 - halo), min(h, y1 + halo)
+
+def feather_mask(shape, rect, feather, x0, y0, x1, y1):
+    h, w = shape
+    halo = feather // 2
+    ax0, ay0 = max(0, x0 - halo), max(0, y0 - halo)
+    ax1, ay1 = min(w, x1 + halo), min(h, y1 + halo)
+    mask = np.full((ay1 - ay0, ax1 - ax0), 255, dtype=np.uint8)
+    cv2.rectangle(mask, (rect[0] - ax0, rect[1] - ay0), (rect[2] - ax0, rect[3] - ay0), 0, -1)
+    mask = cv2.GaussianBlur(mask, (feather, feather), 0)
+    return mask[y0 - ay0:y1 - ay0, x0 - ax0:x1 - ax0]
+
+def render_effect(img, mode, ksize=0, sigma=0, block_size=1, small_interpolation=cv2.INTER_LINEAR):
+    if mode not in ("blur", "pixelate"): return img
+    h, w = img.shape[:2]
+    if mode == "pixelate":
+        small = cv2.resize(img, (max(1, w // block_size), max(1, h // block_size)), interpolation=small_interpolation)
+        out = np.empty_like(img)
+        cv2.resize(small, (w, h), dst=out, interpolation=cv2.INTER_NEAREST)
+        return out
+
+    return gaussian_blur(img, ksize, sigma)
+
+def gaussian_blur(img, ksize=0, sigma=0):
+    # The derived sigma only picks the pyramid factor; OpenCV keeps its fixed small kernels when sigma is 0
+    kernel_sigma = sigma
+    if not sigma: sigma = 0.3 * ((ksize - 1) * 0.5 - 1) + 0.8
+    h, w = img.shape[:2]
+    out = np.empty_like(img)
+    factor = 1
+    while sigma / (factor * 2) >= BLUR_PYRAMID_SIGMA: factor *= 2
+
+    if factor == 1:
+        if not ksize: ksize = int(round(sigma * 6 + 1)) | 1
+        halo = ksize // 2
+        for y0, y1, a, b in strip_bounds(h, max(STRIP_ROWS, halo), halo):
+            out[y0:y1] = cv2.GaussianBlur(img[a:b], (ksize, ksize), kernel_sigma)[y0 - a:y1 - a]
+        return out
+
+    # Area downscale and bilinear upscale add roughly factor/2 of blur on their own
+    small = cv2.resize(img, (max(1, round(w / factor)), max(1, round(h / factor))), interpolation=cv2.INTER_AREA)
+    small_sigma = math.sqrt(max(sigma * sigma - factor * factor / 4.0, 1.0)) / factor
+    small = cv2.GaussianBlur(small, (0, 0), small_sigma)
+    cv2.resize(small, (w, h), dst=out, interpolation=cv2.INTER_LINEAR)
+    return out
+
+def blend_feathered(base, layer, rect, feather):
+    h, w = base.shape[:2]
+    halo = feather // 2
+    rx0, rx1 = sorted((rect[0], rect[2]))
+    ry0, ry1 = sorted((rect[1], rect[3]))
+    out = layer.copy()
+
+    # Only pixels within half a kernel of the rectangle edge mix both sources
+    bx0, by0 = max(0, rx0 - halo), max(0, ry0 - halo)
+    bx1, by1 = min(w, rx1 + halo + 1), min(h, ry1 + halo + 1)
+    if bx1 <= bx0 or by1 <= by0: return out
+    ix0, iy0 = max(bx0, rx0 + halo), max(by0, ry0 + halo)
+    ix1, iy1 = min(bx1, rx1 - halo + 1), min(by1, ry1 - halo + 1)
+
+    if ix1 > ix0 and iy1 > iy0:
+        out[iy0:iy1, ix0:ix1] = base[iy0:iy1, ix0:ix1]
+        bands = [(bx0, by0, bx1, iy0), (bx0, iy1, bx1, by1), (bx0, iy0, ix0, iy1), (ix1, iy0, bx1, iy1)]
+    else:
+        bands = [(bx0, by0, bx1, by1)]
+
+    for x0, y0, x1, y1 in bands:
+        if x1 <= x0 or y1 <= y0: continue
+        m = feather_mask((h, w), (rx0, ry0, rx1, ry1), feather, x0, y0, x1, y1)[:, :, None].astype(np.uint16)
+        out[y0:y1, x0:x1] = (base[y0:y1, x0:x1] * (255 - m) + layer[y0:y1, x0:x1] * m + 127) // 255
+    return out
+
+def build_proxy(img, interpolation):
+    h, w = img.shape[:2]
+    scale = PROXY_SIZE / max(h, w)
+    if scale < 1:
+        new_w, new_h = int(w * scale), int(h * scale)
+        img = cv2.resize(img, (new_w, new_h), interpolation=interpolation)
+    return img
+
+class MipPyramid:
+    def __init__(self, img):
+        self.source = weakref.ref(img)
+        self.levels = []
+
+    def level(self, base, scale):
+        img, level_scale = base, 1.0
+        i = 0
+        while level_scale / 2 >= scale and min(img.shape[:2]) > 1:
+            if i == len(self.levels):
+                h, w = img.shape[:2]
+                self.levels.append(cv2.resize(img, (max(1, w // 2), max(1, h // 2)), interpolation=cv2.INTER_AREA))
+            img = self.levels[i]
+            level_scale = img.shape[1] / base.shape[1]
+            i += 1
+        return img, level_scale
+
+def pyramid_level(pyramids, img, scale):
+    pyramid = pyramids.get(id(img))
+    if pyramid is None or pyramid.source() is not img:
+        for key in [k for k, p in list(pyramids.items()) if p.source() is None]: pyramids.pop(key, None)
+        pyramid = pyramids[id(img)] = MipPyramid(img)
+    return pyramid.level(img, scale)
+
+def warp_window(src, scale, origin, size, interpolation):
+    # Same pixel-centre mapping as cv2.resize, cropped to the window whose corner sits at origin in the resized image
+    sx, sy = scale
+    M = np.float32([[sx, 0, 0.5 * sx - 0.5 - origin[0]], [0, sy, 0.5 * sy - 0.5 - origin[1]]])
+    return cv2.warpAffine(src, M, size, flags=interpolation, borderMode=cv2.BORDER_REPLICATE)
+
+class SharedDecode:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.refs = 0
+        self.size = None
+        self.proxy = None
+        self.original = None
+        self.packed = None
+        self.reloadable = False
+        self.evictions = 0
+        self.pyramids = {}
+
+    def nbytes(self):
+        total = self.proxy.nbytes if self.proxy is not None else 0
+        if self.original is not None and self.original is not self.proxy: total += self.original.nbytes
+        if self.packed is not None: total += self.packed.nbytes
+        for pyramid in list(self.pyramids.values()):
+            if pyramid.source() is not None: total += sum(level.nbytes for level in pyramid.levels)
+        return total
+
+    def drop_original(self):
+        if self.original is None or self.original is self.proxy: return 0
+        before = self.nbytes()
+        if not self.reloadable and self.packed is None:
+            ok, data = cv2.imencode(".png", self.original, [cv2.IMWRITE_PNG_COMPRESSION, 1])
+            if not ok: return 0
+            self.packed = data
+        self.pyramids.pop(id(self.original), None)
+        self.original = None
+        self.evictions += 1
+        return before - self.nbytes()
+
+class MemoryBudget:
+    def __init__(self, limit_mb=DEFAULT_MEMORY_BUDGET_MB):
+        self.limit_bytes = limit_mb * 1024 * 1024
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+
+    def live(self):
+        found = []
+        with self.lock:
+            for key, ref in list(self.entries.items()):
+                shared = ref()
+                if shared is None: del self.entries[key]
+                else: found.append(shared)
+        return found
+
+    def usage(self):
+        return sum(shared.nbytes() for shared in self.live())
+
+    def touch(self, shared):
+        with self.lock:
+            self.entries[id(shared)] = weakref.ref(shared)
+            self.entries.move_to_end(id(shared))
+        self.enforce()
+
+    def enforce(self):
+        live = self.live()
+        total = sum(shared.nbytes() for shared in live)
+        for shared in live[:-1]:
+            if total <= self.limit_bytes: break
+            if not shared.lock.acquire(blocking=False): continue
+            try: total -= shared.drop_original()
+            finally: shared.lock.release()
+
+    def set_limit(self, limit_mb):
+        self.limit_bytes = max(1, int(limit_mb)) * 1024 * 1024
+        self.enforce()
+
+    def admits(self, w, h):
+        # Half the budget, leaving room for the preview and effect buffers built from it
+        return w * h * 3 <= self.limit_bytes // 2
+
+MEMORY_BUDGET = MemoryBudget()
+
+def lookup_render(entries, key, interpolation, high):
+    # A finished high-quality render is always good enough while interacting
+    for quality in (high, interpolation):
+        entry = entries.get(key + (quality,))
+        if entry is not None:
+            entries.move_to_end(key + (quality,))
+            return entry
+    return None
+
+class RenderCache:
+    def __init__(self, limit_mb=RENDER_CACHE_MB):
+        self.limit_bytes = limit_mb * 1024 * 1024
+        self.entries = OrderedDict()
+        self.nbytes = 0
+
+    def resize(self, owner, source, size, interpolation, high=cv2.INTER_LANCZOS4):
+        key = (id(owner), size)
+        entry = lookup_render(self.entries, key, interpolation, high)
+        if entry is not None and entry[0]() is source: return entry[1]
+        img = cv2.resize(source, size, interpolation=interpolation)
+        for quality in (*INTERACTIVE_INTERPOLATIONS, high): self.discard(key + (quality,))
+        self.put(key + (interpolation,), (weakref.ref(source), img))
+        return img
+
+    def discard(self, key):
+        old = self.entries.pop(key, None)
+        if old is not None: self.nbytes -= old[1].nbytes
+
+    def put(self, key, entry):
+        self.discard(key)
+        self.entries[key] = entry
+        self.nbytes += entry[1].nbytes
+        while self.nbytes > self.limit_bytes and len(self.entries) > 1:
+            _, (_, img) = self.entries.popitem(last=False)
+            self.nbytes -= img.nbytes
+
+    def clear(self):
+        self.entries.clear()
+        self.nbytes = 0
+
+RENDER_CACHE = RenderCache()
+
+class DecodeRegistry:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = {}
+
+    def acquire(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                entry = self.entries[key] = SharedDecode()
+            entry.refs += 1
+            return entry
+
+    def release(self, key, entry):
+        with self.lock:
+            entry.refs -= 1
+            if entry.refs <= 0 and self.entries.get(key) is entry:
+                del self.entries[key]
+
+DECODE_REGISTRY = DecodeRegistry()
+
+class ProxyCache:
+    def __init__(self, folder=PROXY_CACHE_DIR, limit_mb=DEFAULT_PROXY_CACHE_MB):
+        self.folder = folder
+        self.limit_bytes = limit_mb * 1024 * 1024
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    def entry_path(self, key):
+        digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.folder, f"{digest}.jpg")
+
+    def get(self, key, count=True):
+        path = self.entry_path(key)
+        img = None
+        if self.limit_bytes > 0 and os.path.isfile(path):
+            try:
+                img = read_image(path)
+                os.utime(path)
+            except OSError: pass
+        if count: self.record(img is not None)
+        return img
+
+    def record(self, hit):
+        with self.lock:
+            if hit: self.hits += 1
+            else: self.misses += 1
+
+    def put(self, key, img):
+        if self.limit_bytes <= 0: return
+        ok, data = cv2.imencode(".jpg", img, [cv2.IMWRITE_JPEG_QUALITY, 92])
+        if not ok: return
+        path = self.entry_path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            data.tofile(tmp_path)
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+        with self.lock:
+            self.writes += 1
+            should_trim = self.writes % PROXY_CACHE_TRIM_EVERY == 0
+        if should_trim: self.trim()
+
+    def entries(self):
+        found = []
+        try:
+            with os.scandir(self.folder) as it:
+                for entry in it:
+                    if entry.name.endswith(".jpg") and entry.is_file():
+                        st = entry.stat()
+                        found.append((st.st_mtime, st.st_size, entry.path))
+        except OSError: pass
+        return found
+
+    def usage(self):
+        return sum(size for _, size, _ in self.entries())
+
+    def trim(self):
+        entries = sorted(self.entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.limit_bytes: break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError: pass
+
+    def set_limit(self, limit_mb):
+        self.limit_bytes = max(0, int(limit_mb)) * 1024 * 1024
+        self.trim()
+
+    def clear(self):
+        for _, _, path in self.entries():
+            try: os.remove(path)
+            except OSError: pass
+        with self.lock:
+            self.hits = 0
+            self.misses = 0
+
+PROXY_CACHE = ProxyCache()
+
 class GridTile:
-    def __init__(self, path=None, img_obj=None):
+    def __init__(self, path=None, img_obj=None, deferred=False, member=None):
         self.path = path if path else "clipboard_image"
-        
+        self.member = member
+        self.archive_epoch = ARCHIVES.epoch
+        self.shared = SharedDecode()
+        self.key = None
+        self.thumb = None
+        self.ready = False
+        self.error = None
+        self.future = None
+        self.probe_future = None
+        self.full_future = None
+        self.full_epoch = 0
+        self.full_size = None
+        self.probed = False
+        self.w, self.h = 100, 100
+
         if img_obj:
             pil_image = img_obj.convert("RGB")
-            self.original = cv2.cvtColor(np.array(pil_image), cv2.COLOR_RGB2BGR)
+            self.set_image(cv2.cvtColor(np.array(pil_image), cv2.COLOR_RGB2BGR))
+        elif deferred:
+            pass
         elif path and os.path.exists(path):
-            with open(path, "rb") as f:
-                bytes_data = bytearray(f.read())
-                numpy_array = np.asarray(bytes_data, dtype=np.uint8)
-                self.original = cv2.imdecode(numpy_array, cv2.IMREAD_COLOR)
+            self.decode()
         else:
-            self.original = np.zeros((100, 100, 3), dtype=np.uint8)
-
-        self.h, self.w = self.original.shape[:2]
-
-        self.proxy = self.original
-        scale = 2048 / max(self.h, self.w)
-        if scale < 1:
-            new_w, new_h = int(self.w * scale), int(self.h * scale)
-            self.proxy = cv2.resize(self.original, (new_w, new_h), interpolation=cv2.INTER_LANCZOS4)
+            self.set_image(np.zeros((100, 100, 3), dtype=np.uint8))
 
         self.offset_x = 0
         self.offset_y = 0
         self.scale = 1.0
         self.last_render_w = 0 
         self.last_render_h = 0
-        self.tk_ref = None
+
+    @property
+    def original(self):
+        return self.shared.original
+
+    @property
+    def proxy(self):
+        return self.shared.proxy
+
+    @property
+    def name(self):
+        return Path(self.member).name if self.member else Path(self.path).name
+
+    def read_source(self, flags=cv2.IMREAD_COLOR):
+        if self.member is None: return read_image(self.path, flags)
+        return decode_image_bytes(read_archive_member(self.path, self.member, self.archive_epoch), flags)
+
+    def probe_size(self, source=None):
+        size = probe_image_size(source if source is not None else self.path)
+        if size:
+            self.w, self.h = size
+            self.probed = True
+
+    def probe(self):
+        return probe_image_size(self.path), read_exif_thumbnail(self.path)
+
+    def apply_probe(self, size, thumb):
+        if self.ready or self.error: return
+        if size and not self.probed:
+            self.w, self.h = size
+            self.probed = True
+        self.thumb = thumb
+
+    def attach(self):
+        self.key = file_identity(self.path, self.member)
+        self.shared = DECODE_REGISTRY.acquire(self.key)
+        self.shared.reloadable = True
+        weakref.finalize(self, DECODE_REGISTRY.release, self.key, self.shared)
+
+    def decode(self):
+        try:
+            self.attach()
+            shared = self.shared
+            with shared.lock:
+                if shared.proxy is None:
+                    data = None
+                    # Archive members have no cheap size probe, so try the proxy cache before inflating them
+                    cached = PROXY_CACHE.get(self.key, count=False) if self.member is not None else None
+                    if cached is None:
+                        if self.member is not None: data = read_archive_member(self.path, self.member, self.archive_epoch)
+                        if not self.probed: self.probe_size(io.BytesIO(data) if data is not None else None)
+                    cacheable = self.probed and max(self.w, self.h) > PROXY_SIZE
+                    # Members only count once their size shows they could have been cached
+                    if self.member is not None and (cached is not None or cacheable): PROXY_CACHE.record(cached is not None)
+                    if cached is None and cacheable and self.member is None: cached = PROXY_CACHE.get(self.key)
+                    if cached is not None:
+                        # Layout only needs the aspect ratio; load_original() restores the exact size
+                        shared.size = match_orientation((self.w, self.h), cached) if self.probed else (cached.shape[1], cached.shape[0])
+                        shared.proxy = freeze(cached)
+                    else:
+                        factor, flag = reduced_decode_flag(self.w, self.h, PROXY_SIZE) if self.probed else (1, cv2.IMREAD_COLOR)
+                        img = decode_image_bytes(data, flag) if data is not None else read_image(self.path, flag)
+                        if img is None: raise ValueError(f"Unsupported image: {self.name}")
+                        if factor == 1:
+                            shared.original = freeze(img)
+                            shared.size = (img.shape[1], img.shape[0])
+                            shared.proxy = freeze(build_proxy(img, cv2.INTER_LANCZOS4))
+                        else:
+                            shared.size = match_orientation((self.w, self.h), img)
+                            shared.proxy = freeze(build_proxy(img, cv2.INTER_AREA))
+                        if cacheable: PROXY_CACHE.put(self.key, shared.proxy)
+            self.w, self.h = shared.size
+            self.ready = True
+            self.thumb = None
+            MEMORY_BUDGET.touch(shared)
+        except Exception as e:
+            self.error = e
+            self.thumb = None
+
+    def set_image(self, img):
+        self.shared.original = freeze(img)
+        self.shared.size = (img.shape[1], img.shape[0])
+        self.shared.proxy = freeze(build_proxy(img, cv2.INTER_LANCZOS4))
+        self.w, self.h = self.shared.size
+        self.ready = True
+        MEMORY_BUDGET.touch(self.shared)
+
+    def load_original(self):
+        shared = self.shared
+        with shared.lock:
+            if shared.original is None and self.ready:
+                img = None
+                if shared.packed is not None: img = cv2.imdecode(shared.packed, cv2.IMREAD_COLOR)
+                elif os.path.isfile(self.path): img = self.read_source()
+                if img is not None:
+                    shared.original = freeze(img)
+                    shared.size = (img.shape[1], img.shape[0])
+            original = shared.original
+        if shared.size: self.w, self.h = shared.size
+        if original is not None: MEMORY_BUDGET.touch(shared)
+        return original
+
+    def needs_full_res(self, render_w, render_h):
+        if self.original is not None or not self.ready: return False
+        ph, pw = self.proxy.shape[:2]
+        return render_w > pw or render_h > ph
+
+    def render_source(self, render_w, render_h):
+        if not self.ready: return self.thumb
+        proxy = self.proxy
+        if proxy is None: return None
+        ph, pw = proxy.shape[:2]
+        if render_w > pw or render_h > ph:
+            if self.original is None: return proxy
+            MEMORY_BUDGET.touch(self.shared)
+            return self.original
+        # Smallest proxy level that still covers the on-screen size
+        return pyramid_level(self.shared.pyramids, proxy, max(render_w / pw, render_h / ph))[0]
+
+    def render_roi(self, original, render_w, render_h, left, top, cw, ch, interpolation):
+        x0, y0 = max(0, left), max(0, top)
+        x1, y1 = min(render_w, left + cw), min(render_h, top + ch)
+        if x1 <= x0 or y1 <= y0: return None, x0, y0
+        img, _ = pyramid_level(self.shared.pyramids, original, render_w / original.shape[1])
+        scale = (render_w / img.shape[1], render_h / img.shape[0])
+        return warp_window(img, scale, (x0, y0), (x1 - x0, y1 - y0), interpolation), x0, y0
+
+    def cancel(self):
+        if self.probe_future: self.probe_future.cancel()
+        if self.future: self.future.cancel()
+
+    def wait(self):
+        if self.future and not self.future.cancelled(): self.future.result()
 
     def reset(self):
         self.offset_x = 0
@@ -408,9 +1137,13 @@ class Cropper:
             "last_gap_bg": "#0d0d0d",
             "collage_prefix": "collage_",
             "crop_suffix": "_crop",
-            "output_folder": ""
+            "output_folder": "",
+            "proxy_cache_mb": DEFAULT_PROXY_CACHE_MB,
+            "memory_budget_mb": DEFAULT_MEMORY_BUDGET_MB
         }
         self.load_settings()
+        PROXY_CACHE.set_limit(self.settings["proxy_cache_mb"])
+        MEMORY_BUDGET.set_limit(self.settings["memory_budget_mb"])
         self.brand_color = self.settings["brand_color"]
         
         self.root.overrideredirect(True) 
@@ -439,9 +1172,21 @@ class Cropper:
 
         self.preview_after_id = None
         self.original = None
+        self.image_size = (0, 0)
+        self.full_res_future = None
+        self.load_generation = 0
         self.processed_image = None
+        self.preview_base = None
+        self.effect_cache = None
+        self.display_scale = None
+        self.display_pyramids = {}
         self.path = None
-        self.displayed_photo = None
+        self.screen_tiles = OrderedDict()
+        self.screen_tiles_source = None
+        self.scene = {}
+        self.scene_seen = set()
+        self.frame = None
+        self.frame_surface = BlitSurface()
         self.displayed_size = (0, 0)
         
         self.single_scale = 1.0
@@ -482,6 +1227,24 @@ class Cropper:
         self.banners_active = {'top': False, 'bottom': False, 'left': False, 'right': False}
         self.banner_images = {'top': None, 'bottom': None, 'left': None, 'right': None}
 
+        self.decode_pool = ThreadPoolExecutor(max_workers=DECODE_WORKERS, thread_name_prefix="decode")
+        self.preview_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="preview")
+        self.preview_future = None
+        self.preview_generation = 0
+        self.preview_shown = 0
+        self.ui_queue = queue.Queue()
+        self.render_after_id = None
+        self.render_full = False
+        self.render_indices = set()
+        self.last_render_at = 0.0
+        self.ingest_status_pending = False
+        self.interacting = False
+        self.interactive_level = len(INTERACTIVE_INTERPOLATIONS) - 1
+        self.frame_ms = None
+        self.settle_after_id = None
+        self.settle_full = False
+        self.settle_indices = set()
+
         self.load_assets()
 
         top_bar = Frame(root, bg=BG, height=60)
@@ -633,11 +1396,14 @@ class Cropper:
         self.canvas.drop_target_register(DND_FILES)
         self.canvas.dnd_bind('<<Drop>>', self.on_drop)
         self.root.protocol("WM_DELETE_WINDOW", lambda: self.on_close())
+        self.root.after(UI_POLL_MS, self.pump_ui_queue)
 
     def on_close(self):
         if self.settings["save_gap_bg"]:
             self.settings["last_gap_bg"] = self.grid_bg_var.get()
             self.save_settings()
+        self.decode_pool.shutdown(wait=False, cancel_futures=True)
+        self.preview_pool.shutdown(wait=False, cancel_futures=True)
         self.root.destroy()
         sys.exit(0)
 
@@ -658,7 +1424,7 @@ class Cropper:
     def open_settings_window(self):
         win = Toplevel(self.root)
         win.title("Settings")
-        win.geometry("400x440")
+        win.geometry("400x560")
         win.configure(bg=BG)
         win.resizable(False, False)
         
@@ -669,8 +1435,8 @@ class Cropper:
         root_w = self.root.winfo_width()
         root_h = self.root.winfo_height()
         x = root_x + (root_w // 2) - 200
-        y = root_y + (root_h // 2) - 220 
-        win.geometry(f"400x440+{x}+{y}")
+        y = root_y + (root_h // 2) - 280 
+        win.geometry(f"400x560+{x}+{y}")
 
         container = Frame(win, bg=BG, highlightthickness=1, highlightbackground="#333333")
         container.pack(fill="both", expand=True)
@@ -755,6 +1521,36 @@ class Cropper:
         toggle = ModernToggle(f_toggle, variable=iv_save_gap, brand_color=self.brand_color)
         toggle.pack(side="right")
 
+        f_cache = Frame(content, bg=BG)
+        f_cache.pack(fill="x", pady=(0, 5))
+        Label(f_cache, text="Proxy Cache Limit (MB):", bg=BG, fg="#aaaaaa", font=("Segoe UI", 11)).pack(side="left")
+        sv_cache_mb = StringVar(value=str(self.settings.get("proxy_cache_mb", DEFAULT_PROXY_CACHE_MB)))
+        Entry(f_cache, textvariable=sv_cache_mb, bg=BTN_BG, fg="white", font=("Segoe UI", 11), width=8, relief="flat").pack(side="right")
+
+        f_cache_stats = Frame(content, bg=BG)
+        f_cache_stats.pack(fill="x", pady=(0, 10))
+        lbl_cache_stats = Label(f_cache_stats, text="", bg=BG, fg="#666666", font=("Segoe UI", 9))
+        lbl_cache_stats.pack(side="left")
+
+        def refresh_cache_stats():
+            used_mb = PROXY_CACHE.usage() / (1024 * 1024)
+            lbl_cache_stats.config(text=f"{used_mb:.1f} MB used • {PROXY_CACHE.hits} hits • {PROXY_CACHE.misses} misses")
+
+        def clear_cache():
+            PROXY_CACHE.clear()
+            refresh_cache_stats()
+
+        Button(f_cache_stats, text="Clear", bg=BTN_BG, fg="#aaaaaa", relief="flat", padx=10, font=("Segoe UI", 9), command=clear_cache).pack(side="right")
+        refresh_cache_stats()
+
+        f_memory = Frame(content, bg=BG)
+        f_memory.pack(fill="x", pady=(0, 5))
+        Label(f_memory, text="Memory Budget (MB):", bg=BG, fg="#aaaaaa", font=("Segoe UI", 11)).pack(side="left")
+        sv_memory_mb = StringVar(value=str(self.settings.get("memory_budget_mb", DEFAULT_MEMORY_BUDGET_MB)))
+        Entry(f_memory, textvariable=sv_memory_mb, bg=BTN_BG, fg="white", font=("Segoe UI", 11), width=8, relief="flat").pack(side="right")
+
+        Label(content, text=self.memory_status(), bg=BG, fg="#666666", font=("Segoe UI", 9)).pack(anchor="w", pady=(0, 10))
+
         lbl_link = Label(content, text="github.com/kekkodance/cropper", 
                          bg=BG, fg="#555555", font=("Segoe UI", 8), cursor="hand2")
         lbl_link.pack(side="bottom", pady=(0, 15))
@@ -778,11 +1574,25 @@ class Cropper:
                 messagebox.showerror("Error", "Invalid Hex Color code.", parent=win)
                 return
 
+            try: cache_mb = max(0, int(sv_cache_mb.get().strip()))
+            except ValueError:
+                messagebox.showerror("Error", "Invalid proxy cache limit.", parent=win)
+                return
+
+            try: memory_mb = max(64, int(sv_memory_mb.get().strip()))
+            except ValueError:
+                messagebox.showerror("Error", "Invalid memory budget.", parent=win)
+                return
+
             self.settings["brand_color"] = new_color
             self.settings["save_gap_bg"] = bool(iv_save_gap.get())
             self.settings["collage_prefix"] = sv_c_prefix.get()
             self.settings["crop_suffix"] = sv_c_suffix.get()
             self.settings["output_folder"] = sv_output.get().strip()
+            self.settings["proxy_cache_mb"] = cache_mb
+            PROXY_CACHE.set_limit(cache_mb)
+            self.settings["memory_budget_mb"] = memory_mb
+            MEMORY_BUDGET.set_limit(memory_mb)
             
             if self.settings["save_gap_bg"]: self.settings["last_gap_bg"] = self.grid_bg_var.get()
             self.save_settings()
@@ -882,7 +1692,7 @@ class Cropper:
     def update_single_gap(self, val):
         self.single_gap.set(int(val))
         self.lbl_gap_single_val.config(text=str(int(val)))
-        if self.mode_type == "single": self.display()
+        if self.mode_type == "single": self.request_render(interactive=True)
 
     def draw_bg_preview(self):
         self.bg_preview.delete("all")
@@ -911,8 +1721,7 @@ class Cropper:
             try:
                 self.root.winfo_rgb(val)
                 self.draw_bg_preview()
-                if self.mode_type == "grid": self.display_grid()
-                else: self.display()
+                self.request_render()
                 if self.settings["save_gap_bg"]:
                     self.settings["last_gap_bg"] = val
                     self.save_settings()
@@ -986,16 +1795,14 @@ class Cropper:
             H0 = abs(oy1 - oy0)
             if W0 < 1: W0 = 1
             if H0 < 1: H0 = 1
-        elif isinstance(self.original, Image.Image):
-            W0, H0 = self.original.size
         else:
-            H0, W0 = self.original.shape[:2]
+            W0, H0 = self.image_size
 
         gap = self.single_gap.get() if not is_save else int(self.single_gap.get() * (container_w / 1000.0 if is_save else 1)) 
 
         def get_banner_dim(side, adj_dim):
             img = self.banner_images[side]
-            if img and img.original is not None:
+            if img and img.error is None:
                 w, h = img.w, img.h
                 ratio = h / w if side in ['top', 'bottom'] else w / h
                 return adj_dim * ratio
@@ -1005,22 +1812,22 @@ class Cropper:
         
         if self.banners_active['top']:
             img = self.banner_images['top']
-            if img and img.original is not None: R_t = img.h / img.w
+            if img and img.error is None: R_t = img.h / img.w
             else: R_t = DEFAULT_BANNER_THICKNESS_RATIO
             
         if self.banners_active['bottom']:
             img = self.banner_images['bottom']
-            if img and img.original is not None: R_b = img.h / img.w
+            if img and img.error is None: R_b = img.h / img.w
             else: R_b = DEFAULT_BANNER_THICKNESS_RATIO
 
         if self.banners_active['left']:
             img = self.banner_images['left']
-            if img and img.original is not None: R_l = img.w / img.h
+            if img and img.error is None: R_l = img.w / img.h
             else: R_l = DEFAULT_BANNER_THICKNESS_RATIO
             
         if self.banners_active['right']:
             img = self.banner_images['right']
-            if img and img.original is not None: R_r = img.w / img.h
+            if img and img.error is None: R_r = img.w / img.h
             else: R_r = DEFAULT_BANNER_THICKNESS_RATIO
 
         gap_cnt_x = (1 if self.banners_active['left'] else 0) + (1 if self.banners_active['right'] else 0)
@@ -1118,7 +1925,7 @@ class Cropper:
 
         def get_ratio(side, is_vertical_banner):
             img = self.banner_images[side]
-            if img and img.original is not None:
+            if img and img.error is None:
                 w, h = img.w, img.h
                 if is_vertical_banner: return w / h
                 else: return h / w
@@ -1193,16 +2000,161 @@ class Cropper:
                                              
         return metrics
 
-    def cv2_to_imagetk(self, cv_img):
-        rgb = cv2.cvtColor(cv_img, cv2.COLOR_BGR2RGB)
-        img = Image.frombuffer("RGB", (cv_img.shape[1], cv_img.shape[0]), rgb, 'raw', 'RGB', 0, 1)
-        return ImageTk.PhotoImage(image=img)
+    def post_to_ui(self, fn):
+        self.ui_queue.put(fn)
+
+    def pump_ui_queue(self):
+        try:
+            while True:
+                fn = self.ui_queue.get_nowait()
+                try: fn()
+                except Exception as e: print(f"UI Task Error: {e}")
+        except queue.Empty: pass
+        self.root.after(UI_POLL_MS, self.pump_ui_queue)
+
+    def ingest_tiles(self, sources):
+        tiles = [GridTile(path=p, member=m, deferred=True) for p, m in sources]
+        # Sizes and EXIF thumbnails come first so every placeholder is laid out before any full decode
+        for tile in tiles:
+            if tile.member is not None: continue
+            tile.probe_future = self.decode_pool.submit(tile.probe)
+            tile.probe_future.add_done_callback(lambda f, t=tile: self.post_to_ui(lambda: self.on_tile_probed(t, f)))
+        for tile in tiles:
+            tile.future = self.decode_pool.submit(tile.decode)
+            tile.future.add_done_callback(lambda _, t=tile: self.post_to_ui(lambda: self.on_tile_decoded(t)))
+        return tiles
+
+    def request_full_res(self, tile, size):
+        # An original evicted under memory pressure stays on the proxy until the zoom or cell size changes
+        if tile.full_future and (tile.full_epoch == tile.shared.evictions or tile.full_size == size): return
+        tile.full_epoch = tile.shared.evictions
+        tile.full_size = size
+        tile.full_future = self.decode_pool.submit(tile.load_original)
+        tile.full_future.add_done_callback(lambda _: self.post_to_ui(lambda: self.on_tile_decoded(tile)))
+
+    def on_tile_probed(self, tile, future):
+        if future.cancelled() or future.exception(): return
+        tile.apply_probe(*future.result())
+        if any(t is tile for t in self.grid_tiles): self.request_render()
+
+    def on_tile_decoded(self, tile):
+        in_grid = any(t is tile for t in self.grid_tiles)
+        in_banner = any(b is tile for b in self.banner_images.values())
+        if not in_grid and not in_banner: return
+
+        if tile.error:
+            print(f"Load error: {tile.error}")
+            self.show_status(f"Failed to load {tile.name}")
+
+        self.ingest_status_pending = True
+        self.request_render()
+
+    def request_render(self, only_index=-1, interactive=False):
+        if interactive: self.begin_interaction(only_index)
+        if only_index == -1: self.render_full = True
+        else: self.render_indices.add(only_index)
+        if self.render_after_id is not None: return
+        delay = int(FRAME_MS - (time.perf_counter() - self.last_render_at) * 1000)
+        if delay > 0: self.render_after_id = self.root.after(delay, self.flush_render)
+        else: self.render_after_id = self.root.after_idle(self.flush_render)
+
+    def flush_render(self):
+        self.render_after_id = None
+        full, indices = self.render_full, self.render_indices
+        self.render_full = False
+        self.render_indices = set()
+        self.last_render_at = time.perf_counter()
+        interacting = self.interacting
+
+        if self.mode_type == "grid":
+            if full: self.display_grid()
+            else:
+                for i in indices:
+                    if i < len(self.grid_tiles): self.display_grid(only_index=i)
+            if self.ingest_status_pending:
+                self.ingest_status_pending = False
+                loaded = sum(1 for t in self.grid_tiles if t.ready)
+                failed = sum(1 for t in self.grid_tiles if t.error)
+                failed_txt = f" • {failed} failed" if failed else ""
+                self.show_status(f"Loaded {loaded}/{len(self.grid_tiles)}{failed_txt} • {self.memory_status()}")
+        elif self.original is not None: self.display()
+
+        if interacting: self.govern_quality((time.perf_counter() - self.last_render_at) * 1000)
+
+    def begin_interaction(self, only_index=-1):
+        self.interacting = True
+        if only_index == -1: self.settle_full = True
+        else: self.settle_indices.add(only_index)
+        if self.settle_after_id: self.root.after_cancel(self.settle_after_id)
+        self.settle_after_id = self.root.after(SETTLE_MS, self.settle_render)
+
+    def settle_render(self):
+        self.settle_after_id = None
+        self.interacting = False
+        full, indices = self.settle_full, self.settle_indices
+        self.settle_full = False
+        self.settle_indices = set()
+        if full or self.mode_type != "grid": self.request_render()
+        for i in indices: self.request_render(i)
+
+    def govern_quality(self, frame_ms):
+        self.frame_ms = frame_ms if self.frame_ms is None else self.frame_ms * 0.8 + frame_ms * 0.2
+        if self.frame_ms > FRAME_MS * 1.5 and self.interactive_level > 0:
+            self.interactive_level -= 1
+            self.frame_ms = None
+        elif self.frame_ms < FRAME_MS * 0.5 and self.interactive_level < len(INTERACTIVE_INTERPOLATIONS) - 1:
+            self.interactive_level += 1
+            self.frame_ms = None
+
+    def render_interpolation(self, high=cv2.INTER_LANCZOS4):
+        if self.interacting: return INTERACTIVE_INTERPOLATIONS[self.interactive_level]
+        return high
+
+    def memory_status(self):
+        used_mb = MEMORY_BUDGET.usage() / (1024 * 1024)
+        return f"Memory {used_mb:.0f} / {MEMORY_BUDGET.limit_bytes // (1024 * 1024)} MB"
+
+    def color_bgr(self, color):
+        try: r, g, b = self.root.winfo_rgb(color)
+        except: r, g, b = self.root.winfo_rgb(BG)
+        return (b >> 8, g >> 8, r >> 8)
+
+    def begin_frame(self, cw, ch):
+        if self.frame is None or self.frame.shape[:2] != (ch, cw): self.frame = np.empty((ch, cw, 3), np.uint8)
+        self.frame[:] = self.color_bgr(CANVAS_BG)
+        return self.frame
+
+    def present_frame(self):
+        tk_img = self.frame_surface.update(self.frame)
+        self.canvas.tag_lower(self.scene_item(("frame",), "image", (0, 0), anchor=NW, image=tk_img))
+
+    def clear_canvas(self):
+        self.canvas.delete("all")
+        self.scene.clear()
+        self.scene_seen.clear()
+        self.rect = None
+
+    def scene_item(self, key, kind, coords, **opts):
+        item = self.scene.get(key)
+        if item is None:
+            item = self.scene[key] = getattr(self.canvas, f"create_{kind}")(*coords, **opts)
+        else:
+            self.canvas.coords(item, *coords)
+            if opts: self.canvas.itemconfig(item, **opts)
+        self.scene_seen.add(key)
+        return item
+
+    def end_scene(self, prefix=()):
+        stale = [k for k in self.scene if k[:len(prefix)] == prefix and k not in self.scene_seen]
+        for key in stale: self.canvas.delete(self.scene.pop(key))
+        if ("crop",) in stale: self.rect = None
+        self.scene_seen = {k for k in self.scene_seen if k[:len(prefix)] != prefix}
 
     def on_drop(self, e):
         try: files = self.root.tk.splitlist(e.data)
         except: files = e.data.split()
-        files = [f for f in files if os.path.isfile(f)]
-        if not files: return
+        sources = scan_image_sources(files)
+        if not sources: return
         
         mx = e.x_root - self.canvas.winfo_rootx()
         my = e.y_root - self.canvas.winfo_rooty()
@@ -1220,7 +2172,7 @@ class Cropper:
         if banner_metrics:
             for side, rect in banner_metrics.items():
                 if rect['x'] <= mx <= rect['x']+rect['w'] and rect['y'] <= my <= rect['y']+rect['h']:
-                    self.banner_images[side] = GridTile(path=files[0])
+                    self.banner_images[side] = self.ingest_tiles(sources[:1])[0]
                     dropped_on_banner = True
                     break
         
@@ -1230,32 +2182,36 @@ class Cropper:
             return
 
         if self.mode_type == "grid":
-            self.grid_tiles.extend([GridTile(path=f) for f in files])
+            self.grid_tiles.extend(self.ingest_tiles(sources))
             self.update_window_title()
-            self.show_status(f"Added {len(files)} images to grid")
+            self.show_status(f"Added {len(sources)} images to grid")
             self.display_grid()
         
         elif self.original is not None:
-            self.ask_replace_or_collage(files)
+            self.ask_replace_or_collage(sources)
             
-        elif len(files) > 1:
-            self.set_ui_mode("grid"); self.setup_grid(files)
+        elif not self.is_single_file(sources):
+            self.set_ui_mode("grid"); self.setup_grid(sources)
             
         else:
-            self.set_ui_mode("single"); self.load(files[0])
+            self.set_ui_mode("single"); self.load(sources[0][0])
+
+    def is_single_file(self, sources):
+        return len(sources) == 1 and sources[0][1] is None
 
     def paste_from_clipboard(self, e=None):
         try:
             data = self.root.clipboard_get()
             if os.path.exists(data) or "\n" in data:
                 paths = [p.strip() for p in data.split('\n') if os.path.exists(p.strip())]
-                if paths:
+                sources = scan_image_sources(paths)
+                if sources:
                     if self.mode_type=="grid": 
-                        self.grid_tiles.extend([GridTile(path=p) for p in paths])
+                        self.grid_tiles.extend(self.ingest_tiles(sources))
                         self.update_window_title()
                         self.display_grid()
-                    elif len(paths)>1: self.set_ui_mode("grid"); self.setup_grid(paths)
-                    else: self.set_ui_mode("single"); self.load(paths[0])
+                    elif not self.is_single_file(sources): self.set_ui_mode("grid"); self.setup_grid(sources)
+                    else: self.set_ui_mode("single"); self.load(sources[0][0])
                     return
         except: pass
         img = ImageGrab.grabclipboard()
@@ -1266,7 +2222,7 @@ class Cropper:
                 self.display_grid()
             else: self.set_ui_mode("single"); self.load_image_object(img)
     
-    def ask_replace_or_collage(self, files_list):
+    def ask_replace_or_collage(self, sources):
         dialog = Toplevel(self.root)
         dialog.title("Action")
         dialog.geometry("350x180")
@@ -1300,15 +2256,15 @@ class Cropper:
 
         def do_replace():
             dialog.destroy()
-            if len(files_list) > 1:
+            if not self.is_single_file(sources):
                 self.set_ui_mode("grid")
-                self.setup_grid(files_list)
+                self.setup_grid(sources)
             else:
-                self.load(files_list[0])
+                self.load(sources[0][0])
 
         def do_collage():
             dialog.destroy()
-            self.convert_to_collage(files_list)
+            self.convert_to_collage(sources)
 
         Button(btn_frame, text="Replace", bg=BTN_BG, fg="white", relief="flat", 
                font=("Segoe UI", 10), padx=15, pady=6, command=do_replace).pack(side="left", expand=True)
@@ -1332,10 +2288,12 @@ class Cropper:
         
         self.root.wait_window(dialog)
 
-    def convert_to_collage(self, new_files_list):
+    def convert_to_collage(self, new_sources):
         current_path = self.path if self.path else "clipboard_img"
         
-        if self.original is not None:
+        if self.path and os.path.isfile(self.path):
+            base_tile = self.ingest_tiles([(self.path, None)])[0]
+        elif self.original is not None:
             rgb = cv2.cvtColor(self.original, cv2.COLOR_BGR2RGB)
             pil_img = Image.fromarray(rgb)
             base_tile = GridTile(path=current_path, img_obj=pil_img)
@@ -1344,12 +2302,17 @@ class Cropper:
         
         self.grid_tiles = [base_tile]
         
-        self.grid_tiles.extend([GridTile(path=p) for p in new_files_list])
+        self.grid_tiles.extend(self.ingest_tiles(new_sources))
         
         self.original = None
-        self.processed_image = None
-        self.rect = None
+        self.release_single_caches()
         self.coords = None
+        self.load_generation += 1
+        self.preview_generation += 1
+        self.full_res_future = None
+        if self.preview_future: self.preview_future.cancel()
+        self.preview_future = None
+        self.clear_canvas()
         
         self.set_ui_mode("grid")
         self.show_toolbar()
@@ -1395,11 +2358,8 @@ class Cropper:
                 return
 
             if self.rect:
-                self.canvas.delete(self.rect)
-                self.canvas.delete("handle")
-                self.rect = None
+                self.remove_crop_rect()
                 self.original_coords = None
-                self.processed_image = None 
                 self.update_preview()
                 self.update_bottom_ui_state()
             
@@ -1447,7 +2407,7 @@ class Cropper:
             t = self.grid_tiles[self.active_tile_index]
             self.apply_pan_constraint(t, dx, dy, self.active_tile_index)
             self.drag_start_pos = (e.x, e.y)
-            self.display_grid(only_index=self.active_tile_index)
+            self.request_render(self.active_tile_index, interactive=True)
 
     def handle_release(self, e):
         if self.mode_type == "single": 
@@ -1502,7 +2462,7 @@ class Cropper:
             self.single_offset_y += dy
             self.apply_single_pan_constraint()
             self.drag_start_pos = (e.x, e.y)
-            self.display()
+            self.request_render(interactive=True)
 
     def handle_right_release(self, e):
         if self.mode_type == "grid":
@@ -1517,7 +2477,7 @@ class Cropper:
 
             if is_outside:
                 try:
-                    del self.grid_tiles[self.swap_source_index]
+                    self.grid_tiles.pop(self.swap_source_index).cancel()
                     self.show_status("Image removed")
                     
                     if not self.grid_tiles:
@@ -1554,14 +2514,14 @@ class Cropper:
                 new_scale = max(1.0, min(5.0, t.scale * scale_factor))
                 t.scale = new_scale
                 self.apply_pan_constraint(t, 0, 0, idx) 
-                self.display_grid(only_index=idx)
+                self.request_render(idx, interactive=True)
         elif self.mode_type == "single":
             delta = 1 if e.delta > 0 else -1
             scale_factor = 1.1 if delta > 0 else 0.9
             new_scale = max(1.0, min(10.0, self.single_scale * scale_factor))
             self.single_scale = new_scale
             self.apply_single_pan_constraint()
-            self.display()
+            self.request_render(interactive=True)
 
 
     def drag_crop_create(self, e):
@@ -1619,11 +2579,11 @@ class Cropper:
         self.draw_crop_rect()
 
     def draw_crop_rect(self):
-        if self.rect: self.canvas.delete(self.rect)
-        self.canvas.delete("handle")
-        if not self.coords: return
+        if not self.coords:
+            self.remove_crop_rect()
+            return
         
-        self.rect = self.canvas.create_rectangle(*self.coords, outline=self.brand_color, width=2)
+        self.rect = self.scene_item(("crop",), "rectangle", self.coords, outline=self.brand_color, width=2)
         
         x0, y0, x1, y1 = self.coords
         xm, ym = (x0+x1)//2, (y0+y1)//2
@@ -1638,9 +2598,17 @@ class Cropper:
 
         r = HANDLE_SIZE // 2
         for hx, hy, tag in handles:
-            self.canvas.create_rectangle(hx-r, hy-r, hx+r, hy+r, fill=self.brand_color, outline=BG, tags=("handle", tag))
+            self.scene_item(("handle", tag), "rectangle", (hx-r, hy-r, hx+r, hy+r), fill=self.brand_color, outline=BG, tags=("handle", tag))
+        shown = {tag for _, _, tag in handles}
+        for key in [k for k in self.scene if k[0] == "handle" and k[1] not in shown]: self.canvas.delete(self.scene.pop(key))
+        self.canvas.tag_raise(self.rect)
+        self.canvas.tag_raise("handle")
         self.update_bottom_ui_state()
 
+    def remove_crop_rect(self):
+        for key in [k for k in self.scene if k[0] in ("crop", "handle")]: self.canvas.delete(self.scene.pop(key))
+        self.rect = None
+
     def get_handle_at(self, x, y):
         if not self.coords: return None
         x0, y0, x1, y1 = self.coords
@@ -1675,7 +2643,7 @@ class Cropper:
         img_x = c_x + (c_w - disp_w) // 2 + self.single_offset_x
         img_y = c_y + (c_h - disp_h) // 2 + self.single_offset_y
         
-        h, w = self.original.shape[:2]
+        w, h = self.image_size
         scale = disp_w / w
         
         cx0, cy0, cx1, cy1 = self.coords
@@ -1700,7 +2668,7 @@ class Cropper:
         
         if self.original is None: return
         
-        h, w = self.original.shape[:2]
+        w, h = self.image_size
         
         ratio = min(c_w / w, c_h / h)
         base_w = int(w * ratio)
@@ -1770,12 +2738,9 @@ class Cropper:
     def cancel_action(self, e=None):
         if self.mode_type == "single":
             if self.rect:
-                self.canvas.delete(self.rect)
-                self.canvas.delete("handle")
-                self.rect = None
+                self.remove_crop_rect()
                 self.coords = None
                 self.original_coords = None
-                self.processed_image = None
                 self.update_preview()
                 self.update_bottom_ui_state()
             else: self.reset_app()
@@ -1784,8 +2749,14 @@ class Cropper:
     def reset_app(self):
         self.original = None
         self.path = None
+        self.load_generation += 1
+        self.preview_generation += 1
+        self.full_res_future = None
+        for tile in self.grid_tiles: tile.cancel()
         self.grid_tiles = []
-        self.canvas.delete("all")
+        self.clear_canvas()
+        close_archives()
+        RENDER_CACHE.clear()
         gc.collect()
         self.status_label.config(text="") 
         self.draw_welcome()
@@ -1808,7 +2779,15 @@ class Cropper:
         self.coords = None
         self.original_coords = None
         self.rect = None
+        self.release_single_caches()
+
+    def release_single_caches(self):
         self.processed_image = None
+        self.preview_base = None
+        self.effect_cache = None
+        self.display_pyramids = {}
+        self.screen_tiles.clear()
+        self.screen_tiles_source = None
 
     def set_ui_mode(self, mode_type):
         self.mode_type = mode_type
@@ -1914,11 +2893,28 @@ class Cropper:
 
     def load(self, p):
         try:
-            with open(p, "rb") as f:
-                arr = np.asarray(bytearray(f.read()), dtype=np.uint8)
-                img = cv2.imdecode(arr, cv2.IMREAD_COLOR)
-            
+            info = probe_image_info(p)
+            size = info[:2] if info else None
+            # Only JPEG decodes natively at reduced size; other formats get one full decode when it fits the budget
+            preview_target = max(self.root.winfo_screenwidth(), self.root.winfo_screenheight())
+            fits = size is not None and MEMORY_BUDGET.admits(*size)
+            reduced = info is not None and (info[2] in REDUCED_DECODE_FORMATS or not fits)
+            factor, flag = reduced_decode_flag(*size, preview_target) if reduced else (1, cv2.IMREAD_COLOR)
+            img = read_image(p, flag)
+            if img is None: raise ValueError(f"Unsupported image: {Path(p).name}")
+            
+            self.load_generation += 1
+            generation = self.load_generation
+            self.full_res_future = None
             self.original = img
+            if factor > 1:
+                self.image_size = match_orientation(size, img)
+            else:
+                self.image_size = (img.shape[1], img.shape[0])
+            if factor > 1 and fits:
+                self.full_res_future = self.decode_pool.submit(read_image, p)
+                self.full_res_future.add_done_callback(
+                    lambda f: self.post_to_ui(lambda: self.swap_in_full_res(generation, f)))
             self.path = p
             self.single_scale = 1.0
             self.single_offset_x = 0
@@ -1930,7 +2926,7 @@ class Cropper:
             self.effect_mode.set("none") 
             self.mode = "free"
             self.current_mode = "free"
-            self.canvas.delete("all")
+            self.clear_canvas()
             self.display()
             if not self.buttons_shown: self.show_toolbar()
             else: self.set_mode_with_fade("free")
@@ -1940,8 +2936,36 @@ class Cropper:
         except Exception as e:
             print(f"Load error: {e}")
 
+    def swap_in_full_res(self, generation, future):
+        if generation != self.load_generation or future is not self.full_res_future: return
+        self.full_res_future = None
+        try:
+            img = future.result()
+        except Exception as e:
+            print(f"Load error: {e}")
+            return
+        if img is None: return
+
+        self.original = img
+        self.image_size = (img.shape[1], img.shape[0])
+        self.update_preview()
+
+    def wait_full_res(self):
+        if self.full_res_future:
+            future = self.full_res_future
+            future.result()
+            self.swap_in_full_res(self.load_generation, future)
+
+    def full_res_original(self):
+        self.wait_full_res()
+        if self.original.shape[1] == self.image_size[0] or not os.path.isfile(self.path): return self.original
+        return read_image(self.path)
+
     def load_image_object(self, img_obj):
+        self.load_generation += 1
+        self.full_res_future = None
         self.original = cv2.cvtColor(np.array(img_obj.convert("RGB")), cv2.COLOR_RGB2BGR)
+        self.image_size = (self.original.shape[1], self.original.shape[0])
         self.path = "clipboard_image.png"
         self.single_scale = 1.0
         self.single_offset_x = 0
@@ -1953,7 +2977,7 @@ class Cropper:
         self.effect_mode.set("none")
         self.mode = "free"
         self.current_mode = "free"
-        self.canvas.delete("all")
+        self.clear_canvas()
         self.display()
         if not self.buttons_shown: self.show_toolbar()
         else: self.set_mode_with_fade("free")
@@ -1961,72 +2985,68 @@ class Cropper:
         self.update_window_title()
         self.show_status("Drag to Crop • Right-Click to Pan")
 
-    def generate_processed_image(self):
-        if self.original is None: 
-            self.processed_image = None
-            return
-
-        if self.effect_mode.get() == "none":
-            self.processed_image = None
-            return
-
-        val = int(self.strength.get())
-        
-        gpu_src = self.original
-        
-        if self.effect_mode.get() == "blur":
-            h, w = self.original.shape[:2]
+    def effect_preview_source(self, original, native_scale, display_scale):
+        factor = 1.0
+        if display_scale:
+            factor = min(1.0, 2.0 ** math.ceil(math.log2(display_scale / native_scale)))
+        if factor >= 1.0: return original
+
+        cached = self.preview_base
+        if cached and cached[0]() is original and cached[1] == factor: return cached[2]
+        h, w = original.shape[:2]
+        img = cv2.resize(original, (max(1, int(w * factor)), max(1, int(h * factor))), interpolation=cv2.INTER_AREA)
+        self.preview_base = (weakref.ref(original), factor, img)
+        return img
+
+    def preview_job(self):
+        return (self.original, self.image_size, self.display_scale, self.effect_mode.get(), int(self.strength.get()), self.original_coords)
+
+    def render_preview(self, job):
+        original, image_size, display_scale, mode, val, original_coords = job
+        src = self.effect_preview_source(original, original.shape[1] / image_size[0], display_scale)
+        h, w = src.shape[:2]
+        ksize = 0
+        block_size = 1
+        
+        if mode == "blur":
             max_dim = max(h, w)
             
             scale_factor = max_dim / 1000.0 
             
-            k = int(val * 4 * scale_factor) + 1
-            if k % 2 == 0: k += 1
-            
-            gpu_processed = cv2.GaussianBlur(gpu_src, (k, k), 0)
-            
-        elif self.effect_mode.get() == "pixelate" and val > 0:
-            h, w = self.original.shape[:2]
+            ksize = int(val * 4 * scale_factor) + 1
+            if ksize % 2 == 0: ksize += 1
             
-            block_size = max(2, val * 2) 
-            
-            small_w = max(1, w // block_size)
-            small_h = max(1, h // block_size)
-            
-            gpu_small = cv2.resize(gpu_src, (small_w, small_h), interpolation=cv2.INTER_LINEAR)
-            
-            gpu_processed = cv2.resize(gpu_small, (w, h), interpolation=cv2.INTER_NEAREST)
+        elif mode == "pixelate" and val > 0:
+            block_size = max(1, round(max(2, val * 2) * w / image_size[0]))
         else:
-            gpu_processed = gpu_src
+            mode = "none"
 
-        effect_layer = gpu_processed 
-        
-        if self.original_coords:
-            ox0, oy0, ox1, oy1 = map(int, self.original_coords)
-            h, w = self.original.shape[:2]
-            
-            mask = np.ones((h, w), dtype=np.uint8) * 255
-            cv2.rectangle(mask, (ox0, oy0), (ox1, oy1), 0, -1)
+        rect = None
+        feather = 0
+        if original_coords:
+            buf_scale = w / image_size[0]
+            rect = [int(c * buf_scale) for c in original_coords]
             
             feather = max(5, int(min(w, h) * 0.01))
             if feather % 2 == 0: feather += 1
-            mask = cv2.GaussianBlur(mask, (feather, feather), 0)
-            
-            mask_float = mask.astype(float) / 255.0
-            mask_float = np.stack([mask_float]*3, axis=2)
-            
-            blended = (self.original * (1.0 - mask_float) + effect_layer * mask_float).astype(np.uint8)
-            self.processed_image = blended
-        else:
-            self.processed_image = effect_layer
+
+        layer = self.effect_layer(src, mode, ksize, block_size)
+        return blend_feathered(src, layer, rect, feather) if rect else layer
+
+    def effect_layer(self, src, mode, ksize, block_size):
+        key = (mode, ksize, block_size)
+        cached = self.effect_cache
+        if cached and cached[0]() is src and cached[1] == key: return cached[2]
+        layer = render_effect(src, mode, ksize=ksize, block_size=block_size)
+        self.effect_cache = (weakref.ref(src), key, layer)
+        return layer
 
     def display(self):
         if self.original is None: return
         cw, ch = self.canvas.winfo_width(), self.canvas.winfo_height()
         if cw <= 1: self.root.after(100, self.display); return
-        self.canvas.delete("all")
         
-        self.canvas.create_rectangle(0, 0, cw, ch, fill=CANVAS_BG, outline="")
+        frame = self.begin_frame(cw, ch)
         
         metrics = self.get_single_layout_metrics(cw, ch)
         
@@ -2038,11 +3058,7 @@ class Cropper:
             min_x = min(min_x, rect['x']); min_y = min(min_y, rect['y'])
             max_x = max(max_x, rect['x'] + rect['w']); max_y = max(max_y, rect['y'] + rect['h'])
             
-        gap_bg_color = self.grid_bg_var.get()
-        try:
-            self.canvas.create_rectangle(min_x, min_y, max_x, max_y, fill=gap_bg_color, outline="")
-        except:
-            self.canvas.create_rectangle(min_x, min_y, max_x, max_y, fill=BG, outline="")
+        fill_rect(frame, min_x, min_y, max_x, max_y, self.color_bgr(self.grid_bg_var.get()))
         
         for side, rect in metrics['banners'].items():
             self.render_banner_image(side, rect)
@@ -2050,25 +3066,35 @@ class Cropper:
         c_x, c_y, c_w, c_h = metrics['center']['x'], metrics['center']['y'], metrics['center']['w'], metrics['center']['h']
         
         source_img = self.original
-        if self.processed_image is not None and self.effect_mode.get() != "none":
-            source_img = self.processed_image
+        effect_on = self.processed_image is not None and self.effect_mode.get() != "none"
+        if effect_on: source_img = self.processed_image
 
         banners_on = any(self.banners_active.values())
+        region_w, region_h = self.image_size
+        buf_scale = source_img.shape[1] / region_w
+        region = None
 
         if banners_on and self.original_coords:
             ox0, oy0, ox1, oy1 = map(int, self.original_coords)
-            h, w = source_img.shape[:2]
             ox0 = max(0, ox0); oy0 = max(0, oy0)
-            ox1 = min(w, ox1); oy1 = min(h, oy1)
+            ox1 = min(region_w, ox1); oy1 = min(region_h, oy1)
             
             if ox1 > ox0 and oy1 > oy0:
-                source_img = source_img[oy0:oy1, ox0:ox1]
+                region = (ox0, oy0, ox1, oy1)
+                region_w, region_h = ox1 - ox0, oy1 - oy0
 
-        sh, sw = source_img.shape[:2]
+        ratio = min(c_w/region_w, c_h/region_h)
+        nw = int(region_w * ratio * self.single_scale)
+        nh = int(region_h * ratio * self.single_scale)
+        
+        self.display_scale = nw / region_w
+        native_scale = self.original.shape[1] / self.image_size[0]
+        if effect_on and self.preview_future is None and buf_scale < min(native_scale, self.display_scale) * 0.99: self.update_preview_delayed()
 
-        ratio = min(c_w/sw, c_h/sh)
-        nw = int(sw * ratio * self.single_scale)
-        nh = int(sh * ratio * self.single_scale)
+        base_img = source_img
+        source_img, level_scale = pyramid_level(self.display_pyramids, source_img, self.display_scale / buf_scale)
+        buf_scale *= level_scale
+        origin = (region[0] * buf_scale, region[1] * buf_scale) if region else (0, 0)
         
         x = c_x + (c_w-nw)//2 + self.single_offset_x
         y = c_y + (c_h-nh)//2 + self.single_offset_y
@@ -2076,61 +3102,24 @@ class Cropper:
         self.displayed_size = (nw, nh)
 
         try:
-            final_img_tk = None
-            draw_x, draw_y = x, y
-            
-            is_zoomed_heavily = (nw > cw * 3) or (nh > ch * 3)
-
-            if is_zoomed_heavily:
-                view_x1 = max(0, x)
-                view_y1 = max(0, y)
-                view_x2 = min(cw, x + nw)
-                view_y2 = min(ch, y + nh)
-                
-                view_w = view_x2 - view_x1
-                view_h = view_y2 - view_y1
-                
-                if view_w > 0 and view_h > 0:
-                    current_scale = ratio * self.single_scale
-                    
-                    src_x = (view_x1 - x) / current_scale
-                    src_y = (view_y1 - y) / current_scale
-                    src_w = view_w / current_scale
-                    src_h = view_h / current_scale
-                    
-                    pad = 2
-                    sx1 = int(src_x) - pad
-                    sy1 = int(src_y) - pad
-                    sx2 = int(src_x + src_w) + pad + 1
-                    sy2 = int(src_y + src_h) + pad + 1
-                    
-                    sx1 = max(0, sx1); sy1 = max(0, sy1)
-                    sx2 = min(sw, sx2); sy2 = min(sh, sy2)
-                    
-                    if sx2 > sx1 and sy2 > sy1:
-                        source_crop = source_img[sy1:sy2, sx1:sx2]
-                        
-                        target_crop_w = int((sx2 - sx1) * current_scale)
-                        target_crop_h = int((sy2 - sy1) * current_scale)
-                        
-                        if target_crop_w > 0 and target_crop_h > 0:
-                            resized = cv2.resize(source_crop, (target_crop_w, target_crop_h), interpolation=cv2.INTER_LINEAR)
-                            final_img_tk = self.cv2_to_imagetk(resized)
-                            draw_x = int(x + sx1 * current_scale)
-                            draw_y = int(y + sy1 * current_scale)
-            else:
-                resized = cv2.resize(source_img, (nw, nh), interpolation=cv2.INTER_LANCZOS4)
-                final_img_tk = self.cv2_to_imagetk(resized)
-                draw_x, draw_y = x, y
-
-            if final_img_tk:
-                self.displayed_photo = final_img_tk
-                self.canvas.create_rectangle(draw_x, draw_y, draw_x+final_img_tk.width(), draw_y+final_img_tk.height(), fill=CANVAS_BG, outline="")
-                self.canvas.create_image(draw_x, draw_y, anchor=NW, image=final_img_tk, tags="image")
+            vx0 = max(0, -x); vy0 = max(0, -y)
+            vx1 = min(nw, cw - x); vy1 = min(nh, ch - y)
+
+            if vx1 > vx0 and vy1 > vy0:
+                fill_rect(frame, x + vx0, y + vy0, x + vx1, y + vy1, self.color_bgr(CANVAS_BG))
+                view = (base_img, nw, nh, region)
+                scale = nw / (region_w * buf_scale)
+                high = cv2.INTER_LINEAR if nw > cw * 3 or nh > ch * 3 else cv2.INTER_LANCZOS4
+                interpolation = self.render_interpolation(high)
+                T = SCREEN_TILE_SIZE
+                for ty in range(int(vy0) // T, (int(vy1) - 1) // T + 1):
+                    for tx in range(int(vx0) // T, (int(vx1) - 1) // T + 1):
+                        tile = self.screen_tile(view, source_img, tx, ty, scale, origin, interpolation, high)
+                        blit_clipped(frame, tile, x + tx * T, y + ty * T)
             
             if self.original_coords and not banners_on:
                 ox0, oy0, ox1, oy1 = self.original_coords
-                total_scale = nw / sw
+                total_scale = nw / region_w
                 
                 cx0 = (ox0 * total_scale) + x
                 cy0 = (oy0 * total_scale) + y
@@ -2140,13 +3129,32 @@ class Cropper:
                 self.coords = (int(cx0), int(cy0), int(cx1), int(cy1))
                 self.draw_crop_rect()
             elif banners_on and self.rect:
-                self.canvas.delete(self.rect)
-                self.canvas.delete("handle")
-                self.rect = None
+                self.remove_crop_rect()
                 
         except Exception as e: 
             print(f"Display Error: {e}")
 
+        self.present_frame()
+        self.end_scene()
+
+    def screen_tile(self, view, source, tx, ty, scale, origin, interpolation, high):
+        base_img, nw, nh, region = view
+        if self.screen_tiles_source is None or self.screen_tiles_source() is not base_img:
+            self.screen_tiles.clear()
+            self.screen_tiles_source = weakref.ref(base_img)
+
+        key = (nw, nh, region, tx, ty)
+        tile = lookup_render(self.screen_tiles, key, interpolation, high)
+        if tile is not None: return tile
+
+        T = SCREEN_TILE_SIZE
+        w, h = min(T, nw - tx * T), min(T, nh - ty * T)
+        corner = (scale * origin[0] + tx * T, scale * origin[1] + ty * T)
+        tile = warp_window(source, (scale, scale), corner, (w, h), interpolation)
+        self.screen_tiles[key + (interpolation,)] = tile
+        while len(self.screen_tiles) > SCREEN_TILE_CACHE: self.screen_tiles.popitem(last=False)
+        return tile
+
     def _apply_aspect_to_coords(self, x0, y0, x1, y1, mode):
         if mode == "free": return (x0, y0, x1, y1)
         dx = x1 - x0; dy = y1 - y0
@@ -2163,150 +3171,143 @@ class Cropper:
         self.preview_after_id = self.root.after(50, self.update_preview)
 
     def update_preview(self):
+        self.preview_after_id = None
         if self.mode_type != "single" or self.original is None: return
         
-        if not self.coords and self.effect_mode.get() == "none":
+        self.preview_generation += 1
+        if self.preview_future: self.preview_future.cancel()
+        self.preview_future = None
+
+        if self.effect_mode.get() == "none":
+            self.preview_shown = self.preview_generation
             self.processed_image = None
-        else:
-            self.generate_processed_image()
-            
+            self.display()
+            return
+
+        generation, load_generation = self.preview_generation, self.load_generation
+        self.preview_future = self.preview_pool.submit(self.render_preview, self.preview_job())
+        self.preview_future.add_done_callback(
+            lambda f: self.post_to_ui(lambda: self.apply_preview(generation, load_generation, f)))
+        self.display()
+
+    def apply_preview(self, generation, load_generation, future):
+        if future is self.preview_future: self.preview_future = None
+        # Intermediate results may land while scrubbing, but never over a newer one
+        if load_generation != self.load_generation or generation <= self.preview_shown or future.cancelled(): return
+        self.preview_shown = generation
+        try:
+            self.processed_image = future.result()
+        except Exception as e:
+            print(f"Preview error: {e}")
+            return
         self.display()
 
     def save_crop(self):
         if self.original is None: return
+        source = self.full_res_original()
+        if source is None: return
         
-        rgb_original = cv2.cvtColor(self.original, cv2.COLOR_BGR2RGB)
-        pil_original = Image.fromarray(rgb_original)
-        
-        backup_original = self.original
-        self.original = pil_original
-        
-        backup_banners = {}
-        for side, tile in self.banner_images.items():
-            if tile:
-                backup_banners[side] = tile.original
-                if isinstance(tile.original, np.ndarray):
-                    rgb_tile = cv2.cvtColor(tile.original, cv2.COLOR_BGR2RGB)
-                    tile.original = Image.fromarray(rgb_tile)
-
-        try:
-            has_banners = any(self.banners_active.values())
-            is_effect_save = (self.effect_enabled.get() == 1) or has_banners
 
-            if is_effect_save:
-                
-                img_w, img_h = self.original.size
-                
-                target_dim = max(img_w, img_h, 2500)
-                container_size = int(target_dim * 1.5)
+        has_banners = any(self.banners_active.values())
+        is_effect_save = (self.effect_enabled.get() == 1) or has_banners
+        src_h, src_w = source.shape[:2]
 
-                metrics = self.get_single_layout_metrics(container_size, container_size, is_save=True)
-                
-                center = metrics['center']
-                min_x = center['x']; min_y = center['y']
-                max_x = center['x']+center['w']; max_y = center['y']+center['h']
-                
-                for side, rect in metrics['banners'].items():
-                    min_x = min(min_x, rect['x']); min_y = min(min_y, rect['y'])
-                    max_x = max(max_x, rect['x']+rect['w']); max_y = max(max_y, rect['y']+rect['h'])
-                    
-                final_w = max_x - min_x
-                final_h = max_y - min_y
-                
-                bg_color = self.grid_bg_var.get()
-                try: master = Image.new("RGB", (final_w, final_h), bg_color)
-                except: master = Image.new("RGB", (final_w, final_h), BG)
-                
-                for side, rect in metrics['banners'].items():
-                    tile = self.banner_images[side]
-                    rw = rect['w']; rh = rect['h']
-                    rx = rect['x'] - min_x
-                    ry = rect['y'] - min_y
-                    
-                    if not tile:
-                        draw = ImageDraw.Draw(master); draw.rectangle((rx, ry, rx+rw, ry+rh), fill="#151515")
-                    else:
-                        res = tile.original.resize((rw, rh), Image.Resampling.LANCZOS)
-                        master.paste(res, (rx, ry))
+        if is_effect_save:
+            
+            img_w, img_h = self.image_size
+            
+            target_dim = max(img_w, img_h, 2500)
+            container_size = int(target_dim * 1.5)
 
-                cx = center['x'] - min_x
-                cy = center['y'] - min_y
-                cw_save = center['w']
-                ch_save = center['h']
-                
-                to_paste = self.original.copy()
+            metrics = self.get_single_layout_metrics(container_size, container_size, is_save=True)
+            
+            center = metrics['center']
+            min_x = center['x']; min_y = center['y']
+            max_x = center['x']+center['w']; max_y = center['y']+center['h']
+            
+            for side, rect in metrics['banners'].items():
+                min_x = min(min_x, rect['x']); min_y = min(min_y, rect['y'])
+                max_x = max(max_x, rect['x']+rect['w']); max_y = max(max_y, rect['y']+rect['h'])
                 
-                if self.original_coords:
-                    ox0, oy0, ox1, oy1 = map(int, self.original_coords)
-                    ox0 = max(0, ox0); oy0 = max(0, oy0)
-                    ox1 = min(to_paste.width, ox1); oy1 = min(to_paste.height, oy1)
-                    to_paste = to_paste.crop((ox0, oy0, ox1, oy1))
+            final_w = max_x - min_x
+            final_h = max_y - min_y
+            
+            bg_color = self.grid_bg_var.get()
+            try: master = Image.new("RGB", (final_w, final_h), bg_color)
+            except: master = Image.new("RGB", (final_w, final_h), BG)
+            
+            for side, rect in metrics['banners'].items():
+                banner = self.banner_images.get(side)
+                rw = rect['w']; rh = rect['h']
+                rx = rect['x'] - min_x
+                ry = rect['y'] - min_y
                 
-                if self.effect_mode.get() != "none":
-                    full_img = to_paste.copy() 
-                    val = int(self.strength.get())
-                    
-                    effect_layer = None
-
-                    if self.effect_mode.get() == "blur": 
-                        w, h = full_img.size
-                        max_dim = max(w, h)
-                        scale_factor = max_dim / 1000.0
-                        radius = val * 2 * scale_factor
-                        effect_layer = full_img.filter(ImageFilter.GaussianBlur(radius=radius))
-                        
-                    elif self.effect_mode.get() == "pixelate":
-                        w, h = full_img.size
-                        block_size = max(2, val * 2)
-                        small = full_img.resize((max(1, w//block_size), max(1, h//block_size)), Image.Resampling.BILINEAR)
-                        effect_layer = small.resize((w, h), Image.Resampling.NEAREST)
-                    
-                    if effect_layer is not None:
-                        to_paste = effect_layer
+                banner_pil = self.tile_to_pil(banner, (rw, rh)) if banner else None
+                if banner_pil is None:
+                    draw = ImageDraw.Draw(master); draw.rectangle((rx, ry, rx+rw, ry+rh), fill="#151515")
+                else:
+                    master.paste(banner_pil, (rx, ry))
 
-                res_main = to_paste.resize((cw_save, ch_save), Image.Resampling.LANCZOS)
-                master.paste(res_main, (cx, cy))
-                
-                final = master
-                suffix_str = "_full"
-            else: 
-                if not self.original_coords: return
-                ox0, oy0, ox1, oy1 = self.original_coords
+            cx = center['x'] - min_x
+            cy = center['y'] - min_y
+            cw_save = center['w']
+            ch_save = center['h']
+            
+            to_paste = source
+            
+            if self.original_coords:
+                ox0, oy0, ox1, oy1 = map(int, self.original_coords)
                 ox0 = max(0, ox0); oy0 = max(0, oy0)
-                ox1 = min(self.original.width, ox1); oy1 = min(self.original.height, oy1)
-                final = self.original.crop((int(ox0), int(oy0), int(ox1), int(oy1)))
-                suffix_str = self.settings.get("crop_suffix", "_crop")
+                ox1 = min(src_w, ox1); oy1 = min(src_h, oy1)
+                to_paste = to_paste[oy0:oy1, ox0:ox1]
+            
+            if self.effect_mode.get() != "none":
+                val = int(self.strength.get())
+                h, w = to_paste.shape[:2]
 
-            p = Path(self.path)
-            if p.name == "clipboard_image.png": base_name = "clipboard"
-            else: base_name = p.stem
+                if self.effect_mode.get() == "blur": 
+                    scale_factor = max(w, h) / 1000.0
+                    to_paste = render_effect(to_paste, "blur", sigma=val * 2 * scale_factor)
+                    
+                elif self.effect_mode.get() == "pixelate":
+                    to_paste = render_effect(to_paste, "pixelate", block_size=max(2, val * 2), small_interpolation=cv2.INTER_AREA)
+
+            res_main = bgr_to_pil(to_paste).resize((cw_save, ch_save), Image.Resampling.LANCZOS)
+            master.paste(res_main, (cx, cy))
             
-            custom_out = self.settings.get("output_folder", "")
-            if custom_out and os.path.isdir(custom_out):
-                parent_dir = Path(custom_out)
-            else:
-                parent_dir = p.parent
+            final = master
+            suffix_str = "_full"
+        else: 
+            if not self.original_coords: return
+            ox0, oy0, ox1, oy1 = self.original_coords
+            ox0 = max(0, ox0); oy0 = max(0, oy0)
+            ox1 = min(src_w, ox1); oy1 = min(src_h, oy1)
+            final = bgr_to_pil(source[int(oy0):int(oy1), int(ox0):int(ox1)])
+            suffix_str = self.settings.get("crop_suffix", "_crop")
 
-            out = parent_dir / f"{base_name}{suffix_str}{p.suffix}"
-            i = 1
-            while out.exists():
-                out = parent_dir / f"{base_name}{suffix_str}_{i}{p.suffix}"
-                i += 1
-                
-            final.save(out, quality=100)
-            self.show_status(f"Saved: {out.name}")
-        finally:
-            self.original = backup_original
-            for side, tile in self.banner_images.items():
-                if tile and side in backup_banners:
-                    tile.original = backup_banners[side]
+        p = Path(self.path)
+        if p.name == "clipboard_image.png": base_name = "clipboard"
+        else: base_name = p.stem
+        
+        custom_out = self.settings.get("output_folder", "")
+        if custom_out and os.path.isdir(custom_out):
+            parent_dir = Path(custom_out)
+        else:
+            parent_dir = p.parent
+
+        out = parent_dir / f"{base_name}{suffix_str}{p.suffix}"
+        i = 1
+        while out.exists():
+            out = parent_dir / f"{base_name}{suffix_str}_{i}{p.suffix}"
+            i += 1
+            
+        final.save(out, quality=100)
+        self.show_status(f"Saved: {out.name}")
                     
     def on_slider_move(self, val):
         self.strength.set(int(val)); self.lbl_val.config(text=str(int(val)))
-        if self.mode_type == "single": self.cancel_pending_preview()
-
-    def cancel_pending_preview(self):
-        if self.preview_after_id: self.root.after_cancel(self.preview_after_id); self.preview_after_id = None
+        if self.mode_type != "single" or self.effect_mode.get() == "none": return
+        if self.preview_after_id is None: self.preview_after_id = self.root.after_idle(self.update_preview)
 
     def set_effect_type(self, mode):
         new_mode = "none" if self.effect_mode.get() == mode else mode
@@ -2316,16 +3317,26 @@ class Cropper:
         self.update_bottom_ui_state()
         if self.mode_type == "single": self.update_preview_delayed()
 
-    def setup_grid(self, files):
-        self.grid_tiles = [GridTile(path=f) for f in files]
+    def setup_grid(self, sources):
+        for tile in self.grid_tiles: tile.cancel()
+        self.grid_tiles = self.ingest_tiles(sources)
+        self.clear_canvas()
         self.show_toolbar()
-        n = len(files); cols = 2 if n < 5 else 3; 
+        n = len(sources); cols = 2 if n < 5 else 3; 
         if n == 1: cols = 1
         self.slider_cols.set_value(cols); self.grid_cols.set(cols); self.lbl_cols_val.config(text=str(cols))
         self.show_status("Drag: Pan • Right-Drag: Swap • Dbl-Click: Reset")
         self.update_window_title()
         self.display_grid()
 
+    def tile_to_pil(self, tile, size):
+        tile.wait()
+        original = tile.load_original()
+        if original is None: return None
+        # Resample in BGR first so only an output-sized copy is ever converted to PIL
+        interpolation = cv2.INTER_AREA if size[0] < original.shape[1] else cv2.INTER_LANCZOS4
+        return bgr_to_pil(cv2.resize(original, size, interpolation=interpolation))
+
     def get_grid_dimensions(self):
         cw, ch = self.canvas.winfo_width(), self.canvas.winfo_height()
         metrics = self.get_layout_metrics(cw, ch)
@@ -2334,27 +3345,36 @@ class Cropper:
     def render_banner_image(self, side, rect):
         tile = self.banner_images[side]
         x, y, w, h = rect['x'], rect['y'], rect['w'], rect['h']
+        key = ("banner", side)
         
-        self.canvas.create_rectangle(x, y, x+w, y+h, fill=CANVAS_BG, outline="")
+        fill_rect(self.frame, x, y, x+w, y+h, self.color_bgr(CANVAS_BG))
 
         if not tile:
-            self.canvas.create_rectangle(x, y, x+w, y+h, fill="#151515", outline="")
-            self.canvas.create_text(x + w/2, y + h/2, text=side.upper(), fill="#333333", font=("Segoe UI", 14, "bold"))
+            fill_rect(self.frame, x, y, x+w, y+h, self.color_bgr("#151515"))
+            self.scene_item(key + ("label",), "text", (x + w/2, y + h/2), text=side.upper(), fill="#333333", font=("Segoe UI", 14, "bold"))
+            return
+        source = tile.render_source(w, h)
+        if source is None:
+            self.draw_tile_placeholder(tile, x, y, w, h, key)
             return
         try:
-            small = cv2.resize(tile.original, (w, h), interpolation=cv2.INTER_LANCZOS4)
-            tk_img = self.cv2_to_imagetk(small)
-            tile.tk_ref = tk_img 
-            self.canvas.create_image(x, y, anchor=NW, image=tk_img)
+            interpolation = self.render_interpolation() if tile.ready else cv2.INTER_LINEAR
+            blit_clipped(self.frame, RENDER_CACHE.resize(tile, source, (w, h), interpolation), x, y)
         except: pass
 
+    def draw_tile_placeholder(self, tile, x, y, w, h, key):
+        text, color = ("Failed to load", "#aa4444") if tile.error else ("Loading...", "#333333")
+        fill_rect(self.frame, x, y, x+w, y+h, self.color_bgr("#151515"))
+        self.scene_item(key + ("status",), "text", (x + w/2, y + h/2), text=text, fill=color, font=("Segoe UI", 11, "bold"), tags="tile")
+
     def display_grid(self, only_index=-1):
         if not self.grid_tiles and not any(self.banner_images.values()): return
-        if only_index == -1: self.canvas.delete("all")
         cw, ch = self.canvas.winfo_width(), self.canvas.winfo_height()
         metrics = self.get_layout_metrics(cw, ch)
+        if self.frame is None or self.frame.shape[:2] != (ch, cw): only_index = -1
         
         if only_index == -1:
+            frame = self.begin_frame(cw, ch)
             min_x, min_y = 99999, 99999
             max_x, max_y = -99999, -99999
             
@@ -2366,9 +3386,7 @@ class Cropper:
                 min_x = min(min_x, r['x']); min_y = min(min_y, r['y'])
                 max_x = max(max_x, r['x']+r['w']); max_y = max(max_y, r['y']+r['h'])
 
-            bg_color = self.grid_bg_var.get()
-            try: self.canvas.create_rectangle(min_x, min_y, max_x, max_y, fill=bg_color, outline="")
-            except: self.canvas.create_rectangle(min_x, min_y, max_x, max_y, fill=BG, outline="")
+            fill_rect(frame, min_x, min_y, max_x, max_y, self.color_bgr(self.grid_bg_var.get()))
             
             for side, rect in metrics['banners'].items(): self.render_banner_image(side, rect)
         
@@ -2378,6 +3396,8 @@ class Cropper:
         fit_mode = self.mode == "fit"
         cols = self.grid_cols.get()
         gap = self.grid_gap.get()
+        frame = self.frame
+        cell_bg = self.color_bgr(CANVAS_BG)
 
         for i in indices:
             tile = self.grid_tiles[i]
@@ -2456,255 +3476,231 @@ class Cropper:
                 if render_h < ch: tile.offset_y = 0
                 else: tile.offset_y = max(-max_off_y, min(max_off_y, tile.offset_y))
 
+            key = ("tile", i)
             try:
-                self.canvas.create_rectangle(cx, cy, cx+cw, cy+ch, fill=CANVAS_BG, outline="")
-                
-                interpolation = cv2.INTER_LANCZOS4
+                fill_rect(frame, cx, cy, cx+cw, cy+ch, cell_bg)
                 if render_w <= 0 or render_h <= 0: continue
                 
+                source = tile.render_source(render_w, render_h)
+                if source is None:
+                    self.draw_tile_placeholder(tile, cx, cy, cw, ch, key)
+                    continue
+
+                interpolation = self.render_interpolation() if tile.ready else cv2.INTER_LINEAR
+                if tile.needs_full_res(render_w, render_h): self.request_full_res(tile, (render_w, render_h))
+
                 if fit_mode:
-                    small = cv2.resize(tile.proxy, (render_w, render_h), interpolation=interpolation)
-                    tk_img = self.cv2_to_imagetk(small)
-                    tile.tk_ref = tk_img
-                    self.canvas.delete(f"tile_{i}")
-                    self.canvas.create_image(cx, cy, anchor=NW, image=tk_img, tags=f"tile_{i}")
+                    small = RENDER_CACHE.resize(tile, source, (render_w, render_h), interpolation)
+                    blit_clipped(frame, small, cx, cy)
                 else:
-                    small = cv2.resize(tile.proxy, (render_w, render_h), interpolation=interpolation)
-                    img_cx = render_w // 2
-                    img_cy = render_h // 2
-                    left = img_cx - (cw // 2) - int(tile.offset_x)
-                    top = img_cy - (ch // 2) - int(tile.offset_y)
-                    right = left + cw
-                    bottom = top + ch
-                    
-                    src_x_start = max(0, left)
-                    src_y_start = max(0, top)
-                    src_x_end = min(render_w, right)
-                    src_y_end = min(render_h, bottom)
-                    
-                    dst_w = src_x_end - src_x_start
-                    dst_h = src_y_end - src_y_start
-                    
-                    if dst_w > 0 and dst_h > 0:
-                        cropped = small[src_y_start:src_y_end, src_x_start:src_x_end]
-                        tk_img = self.cv2_to_imagetk(cropped)
-                        tile.tk_ref = tk_img 
-                        dest_x = cx + (src_x_start - left)
-                        dest_y = cy + (src_y_start - top)
-                        self.canvas.delete(f"tile_{i}")
-                        self.canvas.create_image(dest_x, dest_y, anchor=NW, image=tk_img, tags=f"tile_{i}")
+                    left = render_w // 2 - (cw // 2) - int(tile.offset_x)
+                    top = render_h // 2 - (ch // 2) - int(tile.offset_y)
+                    if source is tile.original and source is not tile.proxy:
+                        # Deep zoom: resample only the visible window of the full-res image
+                        roi, x0, y0 = tile.render_roi(source, render_w, render_h, left, top, cw, ch, interpolation)
+                        if roi is not None: blit_clipped(frame, roi, cx + x0 - left, cy + y0 - top)
+                    else:
+                        small = RENDER_CACHE.resize(tile, source, (render_w, render_h), interpolation)
+                        blit_clipped(frame, small, cx - left, cy - top, (cx, cy, cx + cw, cy + ch))
 
             except Exception as e: 
                 print(f"Grid Render Error: {e}")
 
+        self.present_frame()
+        self.end_scene(() if only_index == -1 else ("tile", only_index))
+        self.canvas.tag_raise("tile")
+        self.canvas.tag_raise("swap_highlight")
+        self.canvas.tag_raise("remove_indicator")
+
     def save_grid(self):
-        backup_tiles = []
-        for tile in self.grid_tiles:
-            backup_tiles.append(tile.original)
-            rgb = cv2.cvtColor(tile.original, cv2.COLOR_BGR2RGB)
-            tile.original = Image.fromarray(rgb)
-            
-        backup_banners = {}
-        for side, tile in self.banner_images.items():
-            if tile:
-                backup_banners[side] = tile.original
-                rgb_tile = cv2.cvtColor(tile.original, cv2.COLOR_BGR2RGB)
-                tile.original = Image.fromarray(rgb_tile)
-                
-        try:
-            base_grid_w = 3000
-            cw, ch = self.canvas.winfo_width(), self.canvas.winfo_height()
-            metrics_disp = self.get_layout_metrics(cw, ch)
-            
-            disp_gw = metrics_disp['grid']['w']; disp_gh = metrics_disp['grid']['h']
-            if disp_gw == 0: return
-            grid_ar = disp_gh / disp_gw
-            base_grid_h = int(base_grid_w * grid_ar)
-            
-            gap = int(self.grid_gap.get() * (base_grid_w / disp_gw))
-            b_gap = gap if self.banner_gap_enabled.get() == 1 else 0
-            
-            banners_save = {}
-            def get_ratio(side, is_vertical_banner):
-                img = self.banner_images[side]
-                if img and img.original:
-                    w, h = img.original.width, img.original.height
-                    if is_vertical_banner: return w / h
-                    else: return h / w
-                return DEFAULT_BANNER_THICKNESS_RATIO
-
-            final_w = base_grid_w
-            final_h = base_grid_h
-            grid_x = 0; grid_y = 0
-            
-            if self.banners_active['left']:
-                ar = get_ratio('left', True)
-                w = int(base_grid_h * ar)
-                final_w += (w + b_gap)
-                grid_x += (w + b_gap)
-                banners_save['left'] = {'x':0, 'y':0, 'w':w, 'h':base_grid_h} 
-                
-            if self.banners_active['right']:
-                ar = get_ratio('right', True)
-                w = int(base_grid_h * ar)
-                final_w += (w + b_gap)
-                banners_save['right'] = {'x':0, 'y':0, 'w':w, 'h':base_grid_h} 
-                
-            row_w = final_w
-            
-            if self.banners_active['top']:
-                ar = get_ratio('top', False)
-                h = int(row_w * ar)
-                final_h += (h + b_gap)
-                grid_y += (h + b_gap)
-                banners_save['top'] = {'x':0, 'y':0, 'w':row_w, 'h':h}
-                
-            if self.banners_active['bottom']:
-                ar = get_ratio('bottom', False)
-                h = int(row_w * ar)
-                final_h += (h + b_gap)
-                banners_save['bottom'] = {'x':0, 'y':0, 'w':row_w, 'h':h} 
-
-            if 'left' in banners_save: banners_save['left']['y'] = grid_y
-            if 'right' in banners_save:
-                banners_save['right']['x'] = final_w - banners_save['right']['w']
-                banners_save['right']['y'] = grid_y
-            if 'bottom' in banners_save:
-                banners_save['bottom']['y'] = final_h - banners_save['bottom']['h']
+        for tile in self.grid_tiles: tile.wait()
 
-            bg_color = self.grid_bg_var.get()
-            try: master = Image.new("RGB", (final_w, final_h), bg_color)
-            except: master = Image.new("RGB", (final_w, final_h), BG)
-            
-            for side, r in banners_save.items():
-                tile = self.banner_images[side]
-                if not tile: 
-                    draw = ImageDraw.Draw(master); draw.rectangle((r['x'], r['y'], r['x']+r['w'], r['y']+r['h']), fill="#151515")
-                else:
-                    res = tile.original.resize((r['w'], r['h']), Image.Resampling.LANCZOS)
-                    master.paste(res, (r['x'], r['y']))
+        base_grid_w = 3000
+        cw, ch = self.canvas.winfo_width(), self.canvas.winfo_height()
+        metrics_disp = self.get_layout_metrics(cw, ch)
+        
+        disp_gw = metrics_disp['grid']['w']; disp_gh = metrics_disp['grid']['h']
+        if disp_gw == 0: return
+        grid_ar = disp_gh / disp_gw
+        base_grid_h = int(base_grid_w * grid_ar)
+        
+        gap = int(self.grid_gap.get() * (base_grid_w / disp_gw))
+        b_gap = gap if self.banner_gap_enabled.get() == 1 else 0
+        
+        banners_save = {}
+        def get_ratio(side, is_vertical_banner):
+            img = self.banner_images[side]
+            if img and img.error is None:
+                w, h = img.w, img.h
+                if is_vertical_banner: return w / h
+                else: return h / w
+            return DEFAULT_BANNER_THICKNESS_RATIO
 
-            cols = self.grid_cols.get(); rows = math.ceil(len(self.grid_tiles)/cols)
-            cw_standard = (base_grid_w - (gap*(cols-1)))//cols
-            ch = (base_grid_h - (gap*(rows-1)))//rows
+        final_w = base_grid_w
+        final_h = base_grid_h
+        grid_x = 0; grid_y = 0
+        
+        if self.banners_active['left']:
+            ar = get_ratio('left', True)
+            w = int(base_grid_h * ar)
+            final_w += (w + b_gap)
+            grid_x += (w + b_gap)
+            banners_save['left'] = {'x':0, 'y':0, 'w':w, 'h':base_grid_h} 
+            
+        if self.banners_active['right']:
+            ar = get_ratio('right', True)
+            w = int(base_grid_h * ar)
+            final_w += (w + b_gap)
+            banners_save['right'] = {'x':0, 'y':0, 'w':w, 'h':base_grid_h} 
             
-            fit_mode = self.mode == "fit"
+        row_w = final_w
+        
+        if self.banners_active['top']:
+            ar = get_ratio('top', False)
+            h = int(row_w * ar)
+            final_h += (h + b_gap)
+            grid_y += (h + b_gap)
+            banners_save['top'] = {'x':0, 'y':0, 'w':row_w, 'h':h}
+            
+        if self.banners_active['bottom']:
+            ar = get_ratio('bottom', False)
+            h = int(row_w * ar)
+            final_h += (h + b_gap)
+            banners_save['bottom'] = {'x':0, 'y':0, 'w':row_w, 'h':h} 
+
+        if 'left' in banners_save: banners_save['left']['y'] = grid_y
+        if 'right' in banners_save:
+            banners_save['right']['x'] = final_w - banners_save['right']['w']
+            banners_save['right']['y'] = grid_y
+        if 'bottom' in banners_save:
+            banners_save['bottom']['y'] = final_h - banners_save['bottom']['h']
+
+        bg_color = self.grid_bg_var.get()
+        try: master = Image.new("RGB", (final_w, final_h), bg_color)
+        except: master = Image.new("RGB", (final_w, final_h), BG)
+        
+        for side, r in banners_save.items():
+            banner = self.banner_images.get(side)
+            banner_pil = self.tile_to_pil(banner, (r['w'], r['h'])) if banner else None
+            if banner_pil is None: 
+                draw = ImageDraw.Draw(master); draw.rectangle((r['x'], r['y'], r['x']+r['w'], r['y']+r['h']), fill="#151515")
+            else:
+                master.paste(banner_pil, (r['x'], r['y']))
+
+        cols = self.grid_cols.get(); rows = math.ceil(len(self.grid_tiles)/cols)
+        cw_standard = (base_grid_w - (gap*(cols-1)))//cols
+        ch = (base_grid_h - (gap*(rows-1)))//rows
+        
+        fit_mode = self.mode == "fit"
 
-            for i, tile in enumerate(self.grid_tiles):
+        for i, tile in enumerate(self.grid_tiles):
+            if fit_mode:
+                row = i // cols
+                col = i % cols
+                row_start = row * cols
+                row_end = min(row_start + cols, len(self.grid_tiles))
+                row_tiles = self.grid_tiles[row_start:row_end]
                 
-                if fit_mode:
-                    row = i // cols
-                    col = i % cols
-                    row_start = row * cols
-                    row_end = min(row_start + cols, len(self.grid_tiles))
-                    row_tiles = self.grid_tiles[row_start:row_end]
-                    
-                    row_ar_sum = 0
-                    for t in row_tiles:
-                        w, h = t.original.width, t.original.height
-                        row_ar_sum += (w / h)
-                    
-                    gap_space = (len(row_tiles) - 1) * gap
-                    avail_w = base_grid_w - gap_space
-                    
-                    if row_ar_sum == 0: continue
-                    
-                    row_h = int(avail_w / row_ar_sum)
-                    
-                    img_w, img_h = tile.original.width, tile.original.height
-                    target_w = int(row_h * (img_w / img_h))
+                row_ar_sum = 0
+                for t in row_tiles:
+                    row_ar_sum += (t.w / t.h)
+                
+                gap_space = (len(row_tiles) - 1) * gap
+                avail_w = base_grid_w - gap_space
+                
+                if row_ar_sum == 0: continue
+                
+                row_h = int(avail_w / row_ar_sum)
+                
+                img_w, img_h = tile.w, tile.h
+                target_w = int(row_h * (img_w / img_h))
+                
+                tx = grid_x
+                for k in range(col):
+                    pt = row_tiles[k]
+                    pw = int(row_h * (pt.w / pt.h))
+                    tx += pw + gap
                     
-                    tx = grid_x
-                    for k in range(col):
-                        pt = row_tiles[k]
-                        pw = int(row_h * (pt.original.width / pt.original.height))
-                        tx += pw + gap
+                ty = grid_y
+                for r_idx in range(row):
+                    pr_start = r_idx * cols
+                    pr_end = min(pr_start + cols, len(self.grid_tiles))
+                    pr_tiles = self.grid_tiles[pr_start:pr_end]
+                    pr_sum = sum([t.w/t.h for t in pr_tiles])
+                    p_gap = (len(pr_tiles)-1)*gap
+                    if pr_sum > 0:
+                        ty += int((base_grid_w - p_gap)/pr_sum) + gap
                         
-                    ty = grid_y
-                    for r_idx in range(row):
-                        pr_start = r_idx * cols
-                        pr_end = min(pr_start + cols, len(self.grid_tiles))
-                        pr_tiles = self.grid_tiles[pr_start:pr_end]
-                        pr_sum = sum([t.original.width/t.original.height for t in pr_tiles])
-                        p_gap = (len(pr_tiles)-1)*gap
-                        if pr_sum > 0:
-                            ty += int((base_grid_w - p_gap)/pr_sum) + gap
-                            
-                    res = tile.original.resize((target_w, row_h), Image.Resampling.LANCZOS)
-                    master.paste(res, (tx, ty))
-                    
-                else:
-                    row = i//cols; col = i%cols
-                    if row == rows - 1 and len(self.grid_tiles) % cols != 0:
-                        items_in_row = len(self.grid_tiles) % cols
-                        cw = (base_grid_w - (gap * (items_in_row - 1))) // items_in_row
-                    else: cw = cw_standard
+                res = self.tile_to_pil(tile, (target_w, row_h))
+                if res is None: continue
+                master.paste(res, (tx, ty))
+                
+            else:
+                row = i//cols; col = i%cols
+                if row == rows - 1 and len(self.grid_tiles) % cols != 0:
+                    items_in_row = len(self.grid_tiles) % cols
+                    cw = (base_grid_w - (gap * (items_in_row - 1))) // items_in_row
+                else: cw = cw_standard
 
-                    tx = grid_x + col*(cw+gap); ty = grid_y + row*(ch+gap)
-                    
-                    ir = tile.original.width / tile.original.height
-                    cr = cw / ch
-                    
-                    if ir > cr: bh_save = ch; bw_save = int(ch*ir)
-                    else: bw_save = cw; bh_save = int(cw/ir)
-                    
-                    rw_save = int(bw_save * tile.scale); rh_save = int(bh_save * tile.scale)
-                    res = tile.original.resize((rw_save, rh_save), Image.Resampling.LANCZOS)
-                    
-                    screen_scale = base_grid_w / disp_gw
-                    off_x = int(tile.offset_x * screen_scale)
-                    off_y = int(tile.offset_y * screen_scale)
-                    
-                    icx = rw_save//2; icy = rh_save//2
-                    l = icx - (cw//2) - off_x
-                    t = icy - (ch//2) - off_y
-                    crop = res.crop((l, t, l+cw, t+ch))
-                    master.paste(crop, (tx, ty))
+                tx = grid_x + col*(cw+gap); ty = grid_y + row*(ch+gap)
+                
+                ir = tile.w / tile.h
+                cr = cw / ch
+                
+                if ir > cr: bh_save = ch; bw_save = int(ch*ir)
+                else: bw_save = cw; bh_save = int(cw/ir)
+                
+                rw_save = int(bw_save * tile.scale); rh_save = int(bh_save * tile.scale)
+                res = self.tile_to_pil(tile, (rw_save, rh_save))
+                if res is None: continue
+                
+                screen_scale = base_grid_w / disp_gw
+                off_x = int(tile.offset_x * screen_scale)
+                off_y = int(tile.offset_y * screen_scale)
+                
+                icx = rw_save//2; icy = rh_save//2
+                l = icx - (cw//2) - off_x
+                t = icy - (ch//2) - off_y
+                crop = res.crop((l, t, l+cw, t+ch))
+                master.paste(crop, (tx, ty))
 
-            prefix = self.settings.get("collage_prefix", "collage_")
-            
-            custom_out = self.settings.get("output_folder", "")
-            
-            if custom_out and os.path.isdir(custom_out):
-                parent_dir = Path(custom_out)
-                if self.grid_tiles and os.path.exists(self.grid_tiles[0].path):
-                    p = Path(self.grid_tiles[0].path)
-                    base_name = f"{prefix}{p.stem}"
-                else:
-                    base_name = f"{prefix}saved"
+        prefix = self.settings.get("collage_prefix", "collage_")
+        
+        custom_out = self.settings.get("output_folder", "")
+        
+        if custom_out and os.path.isdir(custom_out):
+            parent_dir = Path(custom_out)
+            if self.grid_tiles and os.path.exists(self.grid_tiles[0].path):
+                p = Path(self.grid_tiles[0].path)
+                base_name = f"{prefix}{p.stem}"
             else:
-                if self.grid_tiles and os.path.exists(self.grid_tiles[0].path):
-                    p = Path(self.grid_tiles[0].path)
-                    parent_dir = p.parent
-                    base_name = f"{prefix}{p.stem}"
-                else: 
-                    parent_dir = Path(".")
-                    base_name = f"{prefix}saved"
-            
-            out = parent_dir / f"{base_name}.jpg"
-            
-            i = 1
-            while out.exists():
-                out = parent_dir / f"{base_name}_{i}.jpg"
-                i += 1
+                base_name = f"{prefix}saved"
+        else:
+            if self.grid_tiles and os.path.exists(self.grid_tiles[0].path):
+                p = Path(self.grid_tiles[0].path)
+                parent_dir = p.parent
+                base_name = f"{prefix}{p.stem}"
+            else: 
+                parent_dir = Path(".")
+                base_name = f"{prefix}saved"
+        
+        out = parent_dir / f"{base_name}.jpg"
+        
+        i = 1
+        while out.exists():
+            out = parent_dir / f"{base_name}_{i}.jpg"
+            i += 1
 
-            master.save(out, quality=100)
-            self.show_status(f"Saved: {out.name}")
-            
-        finally:
-            for i, tile in enumerate(self.grid_tiles):
-                tile.original = backup_tiles[i]
-            for side, tile in self.banner_images.items():
-                if tile and side in backup_banners:
-                    tile.original = backup_banners[side]
+        master.save(out, quality=100)
+        self.show_status(f"Saved: {out.name}")
 
     def update_grid_cols(self, val):
         if int(val) != self.grid_cols.get():
-            self.grid_cols.set(int(val)); self.lbl_cols_val.config(text=str(int(val))); self.display_grid()
+            self.grid_cols.set(int(val)); self.lbl_cols_val.config(text=str(int(val))); self.request_render(interactive=True)
 
     def update_grid_gap(self, val):
         if int(val) != self.grid_gap.get():
-            self.grid_gap.set(int(val)); self.lbl_gap_val.config(text=str(int(val))); self.display_grid()
+            self.grid_gap.set(int(val)); self.lbl_gap_val.config(text=str(int(val))); self.request_render(interactive=True)
 
     def get_cell_rect(self, index, off_x, off_y, total_w, total_h):
         cols = self.grid_cols.get()
@@ -2752,7 +3748,7 @@ class Cropper:
         return -1
 
     def draw_welcome(self):
-        self.canvas.delete("all"); w, h = self.canvas.winfo_width(), self.canvas.winfo_height()
+        self.clear_canvas(); w, h = self.canvas.winfo_width(), self.canvas.winfo_height()
         if w<100: return
         cx, cy = w//2, h//2+40
         if self.welcome_icon_photo: self.canvas.create_image(cx, cy-170, image=self.welcome_icon_photo)
@@ -2790,10 +3786,8 @@ class Cropper:
                 self.refresh_single_controls_layout() 
                 self.refresh_grid_controls_layout()
         
-        if self.mode_type == "single": self.display()
-        else: self.display_grid()
-        
         if self.original is None and not self.grid_tiles: self.draw_welcome()
+        else: self.request_render(interactive=True)
 
 if __name__ == "__main__":
     root = TkinterDnD.Tk()